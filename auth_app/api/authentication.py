@@ -0,0 +1,59 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from auth_app.auth_cache.auth_cache import TokenCache
+from auth_app.models import UserProfile
+
+
+class ProfileTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that loads the user and the user's profile in the same query as the token.
+    Views read the profile through get_request_profile without a further query.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Looks up the token with its user and profile joined in.
+        Raises AuthenticationFailed for unknown tokens and inactive users.
+        """
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user', 'user__profile').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
+
+
+class CachedTokenAuthentication(ProfileTokenAuthentication):
+    """
+    ProfileTokenAuthentication that serves known tokens from the TokenCache instead of the database.
+    Cached tokens are dropped when the token is deleted or the user or profile changes, see auth_app.signals.
+    They expire after TOKEN_AUTH_CACHE_TIMEOUT seconds in the shared cache, or TOKEN_AUTH_CACHE_LOCAL_TIMEOUT
+    seconds in the in-process cache, whose invalidations do not reach other processes.
+    """
+
+    def authenticate_credentials(self, key):
+        if (token := TokenCache.get(key)) is not None:
+            return (token.user, token)
+
+        user, token = super().authenticate_credentials(key)
+        TokenCache.set(token)
+        return (user, token)
+
+
+def get_request_profile(request):
+    """
+    Returns the UserProfile of the requesting user, or None if the user is anonymous or has no profile.
+    The profile is cached on request.user, so it is loaded at most once per request,
+    and not at all when ProfileTokenAuthentication already joined it in.
+    """
+    if not request.user.is_authenticated:
+        return None
+    try:
+        return request.user.profile
+    except UserProfile.DoesNotExist:
+        return None
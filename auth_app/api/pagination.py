@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+class ProfileCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the profile lists, ordered by id.
+    Every page is an index range scan, so deep pages cost the same as the first one.
+    Supports custom page size up to a maximum of 100 via query parameter.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = 'id'
@@ -104,6 +104,9 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'first_name',
             'last_name',
             'file',
+            'file_thumbnail',
+            'file_thumbnail_webp',
+            'file_webp',
             'location',
             'tel',
             'description',
@@ -146,6 +149,9 @@ class BusinessProfilesSerializer(serializers.ModelSerializer):
             'first_name',
             'last_name',
             'file',
+            'file_thumbnail',
+            'file_thumbnail_webp',
+            'file_webp',
             'location',
             'tel',
             'description',
@@ -172,5 +178,8 @@ class CustomerProfilesSerializer(serializers.ModelSerializer):
             'first_name',
             'last_name',
             'file',
+            'file_thumbnail',
+            'file_thumbnail_webp',
+            'file_webp',
             'type',
         )
\ No newline at end of file
@@ -1,4 +1,3 @@
-from django.db.models import Avg
 from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -7,9 +6,9 @@ from rest_framework.response import Response
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.exceptions import NotFound, PermissionDenied
 from .serializers import RegistrationSerializer, LoginTokenSerializer, UserProfileSerializer, BusinessProfilesSerializer, CustomerProfilesSerializer
-from auth_app.models import UserProfile
-from reviews.models import Review
-from offers.models import Offer
+from auth_app.models import UserProfile, PlatformStats
+from .pagination import ProfileCursorPagination
+from core.conditional import check_conditions, make_etag, set_validators
 
 
 class RegistrationView(APIView):
@@ -76,10 +75,23 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
     """
     API view to retrieve or update a user's profile.
     Allows only authenticated users and restricts edits to the profile owner.
+    GET responses carry an ETag and Last-Modified derived from the profile's updated_at.
     """
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns the profile, or 304 if the client's copy is still current.
+        """
+        profile = self.get_object()
+        etag = make_etag(request, profile.updated_at)
+        if (response := check_conditions(request, etag, profile.updated_at)) is not None:
+            return response
+
+        serializer = self.get_serializer(profile)
+        return set_validators(Response(serializer.data), etag, profile.updated_at)
+
     def get_object(self):
         """
         Retrieves the requested user profile and checks edit permissions.
@@ -88,7 +100,7 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
         user_id = self.kwargs.get('pk')
 
         try:
-            profile = UserProfile.objects.get(user__id=user_id)
+            profile = UserProfile.objects.select_related('user').get(user__id=user_id)
         except UserProfile.DoesNotExist:
             raise NotFound("No user profile found")
         except Exception as e:
@@ -105,6 +117,7 @@ class BaseInfoView(APIView):
     """
     Public API view returning basic platform statistics.
     Provides counts for reviews, business profiles, offers, and the average rating.
+    Reads the incrementally maintained PlatformStats row instead of counting the tables.
     """
     permission_classes = [AllowAny]
 
@@ -113,53 +126,45 @@ class BaseInfoView(APIView):
         Returns general platform statistics including reviews, ratings, 
         business profiles, and offers for public access.
         """
-        review_count = Review.objects.count()
-        average_rating = Review.objects.aggregate(average_rating=Avg('rating'))['average_rating']
-        average_rating = round(average_rating, 1) if average_rating is not None else 0
-        business_profile_count = UserProfile.objects.filter(type='business').count()
-        offer_count = Offer.objects.count()
+        stats = PlatformStats.load()
 
         data = {
-            "review_count": review_count,
-            "average_rating": average_rating,
-            "business_profile_count": business_profile_count,
-            "offer_count": offer_count,
+            "review_count": stats.review_count,
+            "average_rating": stats.average_rating,
+            "business_profile_count": stats.business_profile_count,
+            "offer_count": stats.offer_count,
         }
         
         return Response(data) 
     
 
-class BusinessProfileListView(APIView):
+class BusinessProfileListView(generics.ListAPIView):
     """
     API view for authenticated users to retrieve all business profiles.
-    Returns serialized data for profiles of type 'business'.
+    Returns cursor-paginated serialized data for profiles of type 'business'.
     """
+    serializer_class = BusinessProfilesSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None
+    pagination_class = ProfileCursorPagination
 
-    def get(self, request):
+    def get_queryset(self):
         """
-        Retrieves and returns all business-type user profiles 
-        as serialized data for authenticated users.
+        Returns all business-type user profiles with their users joined in the same query.
         """
-        business_profiles = UserProfile.objects.filter(type="business")
-        serializer = BusinessProfilesSerializer(business_profiles, many=True)
-        return Response(serializer.data)  
-    
+        return UserProfile.objects.filter(type="business").select_related('user')
+
 
-class CustomerProfileListView(APIView):
+class CustomerProfileListView(generics.ListAPIView):
     """
     API view for authenticated users to retrieve all customer profiles.
-    Returns serialized data for profiles of type 'customer'.
+    Returns cursor-paginated serialized data for profiles of type 'customer'.
     """
+    serializer_class = CustomerProfilesSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None
+    pagination_class = ProfileCursorPagination
 
-    def get(self, request):
+    def get_queryset(self):
         """
-        Retrieves and returns all customer-type user profiles 
-        as serialized data for authenticated users.
+        Returns all customer-type user profiles with their users joined in the same query.
         """
-        customer_profiles = UserProfile.objects.filter(type="customer")
-        serializer = CustomerProfilesSerializer(customer_profiles, many=True)
-        return Response(serializer.data)  
\ No newline at end of file
+        return UserProfile.objects.filter(type="customer").select_related('user')
@@ -0,0 +1,114 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+
+
+class TokenCache:
+    """
+    Caches authenticated tokens together with their user and profile, keyed on the token key.
+    If TOKEN_AUTH_CACHE_ALIAS is set, entries live only in that Django cache, so an invalidation in one
+    process reaches all of them. Otherwise they live in a bounded in-process LRU whose entries expire after
+    TOKEN_AUTH_CACHE_LOCAL_TIMEOUT seconds, which bounds how long other processes may still accept a
+    deleted token or a deactivated user.
+    Tokens are stored pickled, so every request gets its own user and profile objects.
+    Each user has at most one token, so invalidating a user drops that single entry.
+    """
+    _entries = OrderedDict()
+    _user_keys = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_shared_cache():
+        alias = settings.TOKEN_AUTH_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def get_timeout():
+        return settings.TOKEN_AUTH_CACHE_TIMEOUT
+
+    @staticmethod
+    def get_local_timeout():
+        return min(settings.TOKEN_AUTH_CACHE_LOCAL_TIMEOUT, settings.TOKEN_AUTH_CACHE_TIMEOUT)
+
+    @staticmethod
+    def get(key):
+        """
+        Returns a fresh copy of the cached token for the key, or None if it is not cached or expired.
+        """
+        if (shared_cache := TokenCache.get_shared_cache()) is not None:
+            payload = shared_cache.get(f"auth:token:{key}")
+            return pickle.loads(payload) if payload is not None else None
+
+        with TokenCache._lock:
+            entry = TokenCache._entries.get(key)
+            if entry is not None:
+                expires_at, user_id, payload = entry
+                if expires_at > time.monotonic():
+                    TokenCache._entries.move_to_end(key)
+                    return pickle.loads(payload)
+                TokenCache._discard(key)
+        return None
+
+    @staticmethod
+    def set(token):
+        """
+        Caches the token with its user and the user's profile as currently loaded.
+        """
+        payload = pickle.dumps(token)
+        if (shared_cache := TokenCache.get_shared_cache()) is None:
+            TokenCache._store(token.key, token.user_id, payload)
+            return
+        shared_cache.set_many({
+            f"auth:token:{token.key}": payload,
+            f"auth:token-key:{token.user_id}": token.key,
+        }, timeout=TokenCache.get_timeout())
+
+    @staticmethod
+    def delete_token(key):
+        with TokenCache._lock:
+            TokenCache._discard(key)
+        if (shared_cache := TokenCache.get_shared_cache()) is not None:
+            shared_cache.delete(f"auth:token:{key}")
+
+    @staticmethod
+    def delete_user(user_id):
+        """
+        Drops the cached token of the user, e.g. after the user or the profile changed.
+        """
+        with TokenCache._lock:
+            if (key := TokenCache._user_keys.get(user_id)) is not None:
+                TokenCache._discard(key)
+        if (shared_cache := TokenCache.get_shared_cache()) is not None:
+            if (key := shared_cache.get(f"auth:token-key:{user_id}")) is not None:
+                shared_cache.delete_many([f"auth:token:{key}", f"auth:token-key:{user_id}"])
+
+    @staticmethod
+    def clear():
+        with TokenCache._lock:
+            TokenCache._entries.clear()
+            TokenCache._user_keys.clear()
+
+    @staticmethod
+    def _store(key, user_id, payload):
+        """
+        Stores an entry in the in-process cache and evicts the least recently used ones beyond TOKEN_AUTH_CACHE_SIZE.
+        """
+        max_size = settings.TOKEN_AUTH_CACHE_SIZE
+        with TokenCache._lock:
+            TokenCache._discard(key)
+            TokenCache._entries[key] = (time.monotonic() + TokenCache.get_local_timeout(), user_id, payload)
+            TokenCache._user_keys[user_id] = key
+            while len(TokenCache._entries) > max_size:
+                TokenCache._discard(next(iter(TokenCache._entries)))
+
+    @staticmethod
+    def _discard(key):
+        """
+        Removes an entry from the in-process cache. Must be called with the lock held.
+        """
+        entry = TokenCache._entries.pop(key, None)
+        if entry is not None and TokenCache._user_keys.get(entry[1]) == key:
+            del TokenCache._user_keys[entry[1]]
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from auth_app.models import PlatformStats
+
+
+class Command(BaseCommand):
+    """
+    Management command recomputing the stored platform statistics from the source tables.
+    Corrects drift of the incrementally maintained counters.
+    """
+    help = "Recomputes the platform statistics served by the base-info endpoint."
+
+    def handle(self, *args, **options):
+        stats = PlatformStats.reconcile()
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled {stats.review_count} reviews, {stats.business_profile_count} business profiles "
+            f"and {stats.offer_count} offers."
+        ))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0010_userprofile_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='file_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='profile_pics/'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='file_thumbnail_webp',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='profile_pics/'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='file_webp',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='profile_pics/'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:43
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_processed_files(apps, schema_editor):
+    UserProfile = apps.get_model('auth_app', 'UserProfile')
+    UserProfile.objects.exclude(file_thumbnail_webp='').update(file_variants_source=F('file'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0011_userprofile_file_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='file_variants_source',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(mark_processed_files, migrations.RunPython.noop),
+    ]
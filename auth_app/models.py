@@ -1,6 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db import models
+from django.db.models import Count, F, Sum
+from core.tasks import TaskQueue
+from offers.models import Offer
+from reviews.models import Review
 
 TYPE_SELECTION = (
     ('business', 'Business'),
@@ -11,15 +14,84 @@ class UserProfile(models.Model):
     """
     Model representing a user profile with personal, contact, and business info.
     Linked one-to-one with Django's User model and stores profile-specific fields.
+    Keeps a thumbnail and WebP variants of the profile picture, generated after upload by core.images.ImageVariants.
     """
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
     file = models.ImageField(upload_to="profile_pics/", null=True, blank=True)
+    file_thumbnail = models.ImageField(upload_to="profile_pics/", max_length=255, blank=True, editable=False)
+    file_thumbnail_webp = models.ImageField(upload_to="profile_pics/", max_length=255, blank=True, editable=False)
+    file_webp = models.ImageField(upload_to="profile_pics/", max_length=255, blank=True, editable=False)
+    file_variants_source = models.CharField(max_length=255, blank=True, editable=False)
     location = models.CharField(max_length=100, blank=True)
     tel = models.CharField(blank=True, default='')
     description = models.CharField(max_length=255, blank=True)
     working_hours = models.CharField(blank=True)
     type = models.CharField(max_length=9, choices=TYPE_SELECTION)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['type', 'id'], name='userprofile_type_id_idx'),
+        ]
 
     def __str__(self):
-        return f"Profil von {self.user.username}"
\ No newline at end of file
+        return f"Profil von {self.user.username}"
+
+
+class PlatformStats(models.Model):
+    """
+    Single-row store of the public platform statistics shown by the base-info endpoint.
+    Counters and the rating sum are adjusted incrementally from model signals,
+    reconcile() recomputes them from the source tables to correct drift.
+    """
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    business_profile_count = models.IntegerField(default=0)
+    offer_count = models.IntegerField(default=0)
+
+    RECONCILE_TASK = "auth_app.reconcile_platform_stats"
+
+    class Meta:
+        verbose_name_plural = "Platform stats"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @classmethod
+    def load(cls):
+        """
+        Returns the stats row, reconciling it first if it does not exist yet.
+        """
+        stats = cls.objects.filter(pk=1).first()
+        return stats if stats is not None else cls.reconcile()
+
+    @classmethod
+    def adjust(cls, **deltas):
+        """
+        Atomically adds the given deltas to the stored counters in a single UPDATE.
+        If the row does not exist yet, a full reconcile is queued to run after the commit instead.
+        """
+        updated = cls.objects.filter(pk=1).update(**{field: F(field) + delta for field, delta in deltas.items()})
+        if not updated:
+            TaskQueue.enqueue(cls.RECONCILE_TASK)
+
+    @classmethod
+    def reconcile(cls):
+        """
+        Recomputes all counters from the reviews, profiles and offers tables.
+        """
+        ratings = Review.objects.aggregate(count=Count('id'), total=Sum('rating'))
+        stats, created = cls.objects.update_or_create(pk=1, defaults={
+            'review_count': ratings['count'],
+            'rating_sum': ratings['total'] or 0,
+            'business_profile_count': UserProfile.objects.filter(type='business').count(),
+            'offer_count': Offer.objects.count(),
+        })
+        return stats
+
+
+TaskQueue.task(PlatformStats.RECONCILE_TASK, retries=2)(PlatformStats.reconcile)
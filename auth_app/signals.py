@@ -0,0 +1,127 @@
+from functools import partial
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from auth_app.auth_cache.auth_cache import TokenCache
+from core.images import ImageVariants
+from auth_app.models import PlatformStats, UserProfile
+from offers.models import Offer
+from offers.signals import offers_bulk_created
+from reviews.models import Review
+
+
+@receiver(post_save, sender=Review)
+def count_saved_review(sender, instance, created, **kwargs):
+    """
+    Adds new reviews to the stats and applies rating changes of updated ones.
+    The previous rating is remembered by the pre_save handler in reviews.signals.
+    """
+    if created:
+        PlatformStats.adjust(review_count=1, rating_sum=instance.rating)
+    elif getattr(instance, '_previous_rating', instance.rating) != instance.rating:
+        PlatformStats.adjust(rating_sum=instance.rating - instance._previous_rating)
+
+
+@receiver(post_delete, sender=Review)
+def count_deleted_review(sender, instance, **kwargs):
+    """
+    Removes a deleted review and its rating from the stats.
+    """
+    PlatformStats.adjust(review_count=-1, rating_sum=-instance.rating)
+
+
+@receiver(pre_save, sender=UserProfile)
+def remember_previous_type(sender, instance, **kwargs):
+    """
+    Stores the profile type currently saved in the database to detect type changes.
+    """
+    if not instance._state.adding:
+        instance._previous_type = UserProfile.objects.filter(pk=instance.pk).values_list('type', flat=True).first()
+
+
+@receiver(post_save, sender=UserProfile)
+def count_saved_profile(sender, instance, created, **kwargs):
+    """
+    Counts profiles that became business profiles and uncounts those that stopped being one.
+    """
+    was_business = not created and getattr(instance, '_previous_type', None) == 'business'
+    is_business = instance.type == 'business'
+    if was_business != is_business:
+        PlatformStats.adjust(business_profile_count=1 if is_business else -1)
+
+
+@receiver(post_save, sender=UserProfile)
+def generate_profile_image_variants(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Queues thumbnails and WebP variants of a new or replaced profile picture, or their removal with the picture.
+    """
+    if update_fields is not None and 'file' not in update_fields:
+        return
+    if ImageVariants.needs_update(instance, 'file'):
+        ImageVariants.schedule(instance, 'file', settings.PROFILE_THUMBNAIL_SIZE, using=using)
+
+
+@receiver(post_delete, sender=UserProfile)
+def delete_profile_image_variants(sender, instance, using, **kwargs):
+    """
+    Deletes the generated variants of a deleted profile's picture.
+    """
+    ImageVariants.delete_variants(instance, 'file', using=using)
+
+
+@receiver(post_delete, sender=UserProfile)
+def count_deleted_profile(sender, instance, **kwargs):
+    """
+    Uncounts deleted business profiles.
+    """
+    if instance.type == 'business':
+        PlatformStats.adjust(business_profile_count=-1)
+
+
+@receiver(post_save, sender=Offer)
+def count_saved_offer(sender, instance, created, **kwargs):
+    """
+    Counts newly created offers.
+    """
+    if created:
+        PlatformStats.adjust(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def count_deleted_offer(sender, instance, **kwargs):
+    """
+    Uncounts deleted offers.
+    """
+    PlatformStats.adjust(offer_count=-1)
+
+
+@receiver(offers_bulk_created)
+def count_bulk_created_offers(sender, offers, **kwargs):
+    """
+    Counts a batch of bulk-created offers with a single update.
+    """
+    PlatformStats.adjust(offer_count=len(offers))
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, using, **kwargs):
+    """
+    Drops a deleted token from the token cache right away and again once the transaction commits,
+    so that the token can not be cached again from the still uncommitted state.
+    """
+    TokenCache.delete_token(instance.key)
+    transaction.on_commit(partial(TokenCache.delete_token, instance.key), using=using)
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=UserProfile)
+def invalidate_cached_user_token(sender, instance, using, **kwargs):
+    """
+    Drops the cached token of a changed or deleted user or profile, e.g. after a deactivation or a type change.
+    """
+    user_id = instance.user_id if sender is UserProfile else instance.pk
+    TokenCache.delete_user(user_id)
+    transaction.on_commit(partial(TokenCache.delete_user, user_id), using=using)
@@ -0,0 +1,142 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import exceptions
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APITestCase, APIRequestFactory
+from auth_app.api.authentication import ProfileTokenAuthentication, CachedTokenAuthentication, get_request_profile
+from auth_app.auth_cache.auth_cache import TokenCache
+from auth_app.models import UserProfile
+
+
+class ProfileTokenAuthenticationTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.token = Token.objects.create(user=self.user)
+
+    authentication_class = ProfileTokenAuthentication
+
+    def authenticate(self, key):
+        request = Request(
+            APIRequestFactory().get('/', HTTP_AUTHORIZATION='Token ' + key),
+            authenticators=[self.authentication_class()]
+        )
+        request.user
+        return request
+
+    def test_profile_loaded_with_token(self):
+        UserProfile.objects.create(user=self.user, type="business")
+
+        with self.assertNumQueries(1):
+            request = self.authenticate(self.token.key)
+            profile = get_request_profile(request)
+            self.assertIs(get_request_profile(request), profile)
+
+        self.assertEqual(request.user, self.user)
+        self.assertEqual(profile.type, "business")
+
+    def test_missing_profile_is_none(self):
+        with self.assertNumQueries(1):
+            request = self.authenticate(self.token.key)
+            self.assertIsNone(get_request_profile(request))
+
+    def test_invalid_token(self):
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authenticate("invalid")
+
+
+class CachedTokenAuthenticationTest(ProfileTokenAuthenticationTest):
+    authentication_class = CachedTokenAuthentication
+
+    def setUp(self):
+        super().setUp()
+        TokenCache.clear()
+        cache.clear()
+
+    def test_cached_token_needs_no_query(self):
+        UserProfile.objects.create(user=self.user, type="business")
+        first = self.authenticate(self.token.key)
+
+        with self.assertNumQueries(0):
+            second = self.authenticate(self.token.key)
+            profile = get_request_profile(second)
+
+        self.assertEqual(second.user, self.user)
+        self.assertIsNot(second.user, first.user)
+        self.assertEqual(profile.type, "business")
+
+    def test_profile_change_invalidates_token(self):
+        profile = UserProfile.objects.create(user=self.user, type="business")
+        self.authenticate(self.token.key)
+
+        profile.type = "customer"
+        profile.save()
+
+        with self.assertNumQueries(1):
+            request = self.authenticate(self.token.key)
+        self.assertEqual(get_request_profile(request).type, "customer")
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate(self.token.key)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authenticate(self.token.key)
+
+    def test_deleted_token_is_rejected(self):
+        key = self.token.key
+        self.authenticate(key)
+
+        self.token.delete()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.authenticate(key)
+
+    @override_settings(TOKEN_AUTH_CACHE_SIZE=1)
+    def test_least_recently_used_token_is_evicted(self):
+        other_user = User.objects.create_user(username="other", password="testpassword")
+        other_token = Token.objects.create(user=other_user)
+        self.authenticate(self.token.key)
+        self.authenticate(other_token.key)
+
+        with self.assertNumQueries(1):
+            self.authenticate(self.token.key)
+
+    @override_settings(TOKEN_AUTH_CACHE_ALIAS='default')
+    def test_shared_cache_serves_other_processes(self):
+        self.authenticate(self.token.key)
+        TokenCache.clear()
+
+        with self.assertNumQueries(0):
+            request = self.authenticate(self.token.key)
+        self.assertEqual(request.user, self.user)
+
+        self.user.save()
+        TokenCache.clear()
+        with self.assertNumQueries(1):
+            self.authenticate(self.token.key)
+
+    @override_settings(TOKEN_AUTH_CACHE_ALIAS='default')
+    def test_shared_invalidation_reaches_every_process(self):
+        self.authenticate(self.token.key)
+
+        # Another process deletes the token and drops it from the shared cache.
+        cache.delete(f"auth:token:{self.token.key}")
+
+        with self.assertNumQueries(1):
+            self.authenticate(self.token.key)
+
+    @override_settings(TOKEN_AUTH_CACHE_LOCAL_TIMEOUT=0)
+    def test_local_entries_expire_after_local_timeout(self):
+        self.authenticate(self.token.key)
+
+        with self.assertNumQueries(1):
+            self.authenticate(self.token.key)
@@ -1,9 +1,13 @@
+from io import StringIO
+from django.core.management import call_command
 from django.urls import reverse
 from django.contrib.auth.models import User
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
-from auth_app.models import UserProfile
+from auth_app.models import UserProfile, PlatformStats
+from offers.models import Offer
+from reviews.models import Review
 
 
 class BaseInfoTest(APITestCase):
@@ -23,4 +27,45 @@ class BaseInfoTest(APITestCase):
         url = reverse('base-info')
         response = self.client.get(url)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+class BaseInfoStatsTest(APITestCase):
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username="Business", password="testpassword1")
+        self.business_profile = UserProfile.objects.create(user=self.business_user, type="business")
+        self.customer_user = User.objects.create_user(username="Customer", password="testpassword2")
+        UserProfile.objects.create(user=self.customer_user, type="customer")
+        self.offer = Offer.objects.create(user=self.business_user, title="Logo Design")
+        self.review = Review.objects.create(business_user=self.business_user, reviewer=self.customer_user, rating=4, description="Good.")
+        Review.objects.create(business_user=self.business_user, reviewer=self.business_user, rating=5, description="Great.")
+        self.client = APIClient()
+
+    def get_base_info(self):
+        response = self.client.get(reverse('base-info'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_base_info_is_read_in_one_query(self):
+        self.get_base_info()
+
+        with self.assertNumQueries(1):
+            data = self.get_base_info()
+
+        self.assertEqual(data, {"review_count": 2, "average_rating": 4.5, "business_profile_count": 1, "offer_count": 1})
+
+    def test_base_info_follows_updates_and_deletes(self):
+        self.review.rating = 1
+        self.review.save()
+        self.business_profile.type = "customer"
+        self.business_profile.save()
+        self.offer.delete()
+
+        self.assertEqual(self.get_base_info(), {"review_count": 2, "average_rating": 3.0, "business_profile_count": 0, "offer_count": 0})
+
+    def test_reconcile_command_corrects_drift(self):
+        PlatformStats.adjust(review_count=10, offer_count=-1)
+
+        call_command('reconcile_platform_stats', stdout=StringIO())
+
+        self.assertEqual(self.get_base_info(), {"review_count": 2, "average_rating": 4.5, "business_profile_count": 1, "offer_count": 1})
@@ -30,8 +30,26 @@ class ProfileGetBusinessProfilesTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        usernames = [profile['username'] for profile in response.data]
+        usernames = [profile['username'] for profile in response.data['results']]
         self.assertIn(self.user.username, usernames)
 
-        for profile in response.data:
+        for profile in response.data['results']:
             self.assertEqual(profile['type'], 'business')
+
+    def test_get_business_profiles_paginated_in_constant_queries(self):
+        for index in range(7):
+            user = User.objects.create_user(username=f"business{index}", password="testpassword")
+            UserProfile.objects.create(user=user, type='business')
+
+        url = reverse('business-list')
+        usernames = []
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'page_size': 5})
+        while True:
+            usernames += [profile['username'] for profile in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        self.assertEqual(len(usernames), 8)
+        self.assertEqual(len(set(usernames)), 8)
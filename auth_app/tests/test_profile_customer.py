@@ -30,8 +30,8 @@ class ProfileGetCustomerProfilesTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        usernames = [profile['username'] for profile in response.data]
+        usernames = [profile['username'] for profile in response.data['results']]
         self.assertIn(self.user.username, usernames)
 
-        for profile in response.data:
+        for profile in response.data['results']:
             self.assertEqual(profile['type'], 'customer')
\ No newline at end of file
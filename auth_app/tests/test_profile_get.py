@@ -49,4 +49,31 @@ class ProfilGetTestUnauthorized(APITestCase):
         url = reverse('profile-detail', kwargs={'pk': self.user.id})
         response = self.client.get(url)
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProfileConditionalGetTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('profile-detail', kwargs={'pk': self.user.id})
+
+    def test_unchanged_profile_is_answered_with_304(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_changed_profile_is_sent_again(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        self.client.patch(self.url, {"location": "Berlin"}, format="json")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["location"], "Berlin")
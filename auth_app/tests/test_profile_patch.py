@@ -1,5 +1,12 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from PIL import Image
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
@@ -79,4 +86,55 @@ class ProfilPatchTestUnauthorized(APITestCase):
         url = reverse('profile-detail', kwargs={'pk': self.user.id})
         response = self.client.get(url)
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProfileImagePatchTest(APITestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, TASK_QUEUE_BACKEND="immediate")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def test_uploaded_file_gets_thumbnail_and_webp_variants(self):
+        url = reverse('profile-detail', kwargs={'pk': self.user.id})
+
+        buffer = BytesIO()
+        Image.new("RGB", (640, 480), "teal").save(buffer, "PNG")
+        avatar = SimpleUploadedFile("avatar.png", buffer.getvalue(), content_type="image/png")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, {"file": avatar}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["file_thumbnail"])
+
+        response = self.client.get(url)
+        self.assertTrue(response.data["file_thumbnail"].endswith("profile_pics/avatar-thumb.jpg"))
+        self.assertTrue(response.data["file_thumbnail_webp"].endswith("profile_pics/avatar-thumb.webp"))
+        self.assertTrue(response.data["file_webp"].endswith("profile_pics/avatar-full.webp"))
+
+        business = self.client.get(reverse('business-list')).data["results"]
+        self.assertEqual(business[0]["file_thumbnail_webp"], response.data["file_thumbnail_webp"])
+
+    def test_deleted_profile_deletes_variants(self):
+        buffer = BytesIO()
+        Image.new("RGB", (640, 480), "teal").save(buffer, "PNG")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.file = SimpleUploadedFile("avatar.png", buffer.getvalue(), content_type="image/png")
+            self.profile.save()
+        self.profile.refresh_from_db()
+        paths = [self.profile.file_thumbnail.path, self.profile.file_thumbnail_webp.path, self.profile.file_webp.path]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.delete()
+
+        self.assertFalse(any(os.path.exists(path) for path in paths))
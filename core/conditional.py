@@ -0,0 +1,43 @@
+import json
+from hashlib import sha256
+from rest_framework.utils.encoders import JSONEncoder
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(request, *parts) -> str:
+    """
+    Builds a strong ETag from the given version parts of the resource.
+    The absolute URL and the negotiated media type are part of it, since responses embed absolute
+    links and differ per renderer.
+    """
+    media_type = getattr(request, 'accepted_media_type', '')
+    digest = sha256("|".join(map(str, (request.build_absolute_uri(), media_type, *parts))).encode()).hexdigest()
+    return quote_etag(digest[:32])
+
+
+def content_digest(data) -> str:
+    """
+    Returns a digest of serialized response data, for ETags of resources without a version to derive them from.
+    """
+    return sha256(json.dumps(data, cls=JSONEncoder, sort_keys=True).encode()).hexdigest()
+
+
+def check_conditions(request, etag, last_modified=None):
+    """
+    Answers If-None-Match / If-Modified-Since (and If-Match / If-Unmodified-Since) from the validators
+    alone, before anything is serialized. Returns a 304 or 412 response carrying the validators,
+    or None if the full response has to be sent.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
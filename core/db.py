@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    Applies settings.SQLITE_PRAGMAS to every new SQLite connection.
+    journal_mode is stored in the database file, so it is skipped for read-only connections.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    read_only = 'mode=ro' in str(connection.settings_dict['NAME'])
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        if name == 'journal_mode' and read_only:
+            continue
+        connection.connection.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,126 @@
+import os
+from functools import partial
+from io import BytesIO
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+from core.tasks import TaskQueue
+
+
+class ImageVariants:
+    """
+    Generates a fixed-size thumbnail, a WebP thumbnail and a full-size WebP variant of an uploaded image.
+    The variants are stored next to the original and saved in the fields <field>_thumbnail,
+    <field>_thumbnail_webp and <field>_webp of the same model. <field>_variants_source holds the name of
+    the image they were generated from, so each image is processed once, even if it can not be decoded.
+    Processing runs as a task of the TaskQueue once the upload is committed, so the request never decodes the original.
+    """
+    VARIANTS = ("thumbnail", "thumbnail_webp", "webp")
+    JPEG_QUALITY = 85
+    WEBP_QUALITY = 80
+    TASK = "core.generate_image_variants"
+
+    @staticmethod
+    def variant_fields(field_name):
+        return {variant: f"{field_name}_{variant}" for variant in ImageVariants.VARIANTS}
+
+    @staticmethod
+    def variant_name(source_name, variant, extension):
+        """
+        Returns the storage name of a variant, e.g. offers_pics/logo-thumb.webp for offers_pics/logo.png.
+        The storage may add a random suffix if the name is taken.
+        """
+        stem = os.path.splitext(source_name)[0]
+        suffix = "thumb" if variant.startswith("thumbnail") else "full"
+        return f"{stem}-{suffix}.{extension}"
+
+    @staticmethod
+    def needs_update(instance, field_name):
+        """
+        Tells whether the instance's current image, or its removal, was not processed yet.
+        """
+        return (getattr(instance, field_name).name or "") != getattr(instance, f"{field_name}_variants_source")
+
+    @staticmethod
+    def schedule(instance, field_name, size, using="default"):
+        """
+        Queues the variants of the instance's image for generation once the current transaction commits.
+        """
+        TaskQueue.enqueue(ImageVariants.TASK, instance._meta.label, instance.pk, field_name, size, using, using=using)
+
+    @staticmethod
+    @TaskQueue.task(TASK, retries=2)
+    def process(model_label, pk, field_name, size, using="default"):
+        """
+        Renders the variants of the stored image and saves them on the instance,
+        unless the image was replaced in the meantime. A removed image also removes its variants.
+        Files that can not be decoded as images get no variants, but count as processed.
+        """
+        model = apps.get_model(model_label)
+        size = tuple(size)
+        source_name = model.objects.using(using).filter(pk=pk).values_list(field_name, flat=True).first()
+        storage = model._meta.get_field(field_name).storage
+        variants = {}
+        if source_name:
+            try:
+                variants = ImageVariants.render(storage, source_name, size)
+            except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+                variants = {}
+
+        fields = ImageVariants.variant_fields(field_name)
+        with transaction.atomic(using=using):
+            instance = model.objects.using(using).select_for_update().filter(pk=pk).first()
+            if instance is None or (getattr(instance, field_name).name or "") != (source_name or ""):
+                ImageVariants.delete_files(storage, variants.values())
+                return
+            previous = [getattr(instance, field).name for field in fields.values()]
+            for variant, field in fields.items():
+                setattr(instance, field, variants.get(variant, ""))
+            setattr(instance, f"{field_name}_variants_source", source_name or "")
+            instance.save(using=using, update_fields=[*fields.values(), f"{field_name}_variants_source", "updated_at"])
+
+        ImageVariants.delete_files(storage, [name for name in previous if name not in variants.values()])
+
+    @staticmethod
+    def render(storage, source_name, size):
+        """
+        Decodes the original once and stores its variants. Returns the stored names by variant.
+        The thumbnail is cropped to exactly `size`; it is a PNG if the image has transparency, a JPEG otherwise.
+        """
+        with storage.open(source_name) as source:
+            image = Image.open(source)
+            image.load()
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        thumbnail = ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+
+        outputs = {
+            "thumbnail": (thumbnail, "PNG", {"optimize": True}) if has_alpha
+            else (thumbnail, "JPEG", {"quality": ImageVariants.JPEG_QUALITY, "optimize": True, "progressive": True}),
+            "thumbnail_webp": (thumbnail, "WEBP", {"quality": ImageVariants.WEBP_QUALITY, "method": 4}),
+            "webp": (image, "WEBP", {"quality": ImageVariants.WEBP_QUALITY, "method": 4}),
+        }
+        names = {}
+        for variant, (variant_image, image_format, options) in outputs.items():
+            buffer = BytesIO()
+            variant_image.save(buffer, image_format, **options)
+            name = ImageVariants.variant_name(source_name, variant, "jpg" if image_format == "JPEG" else image_format.lower())
+            names[variant] = storage.save(name, ContentFile(buffer.getvalue()))
+        return names
+
+    @staticmethod
+    def delete_variants(instance, field_name, using="default"):
+        """
+        Deletes the variant files of a deleted instance once the transaction commits.
+        """
+        storage = instance._meta.get_field(field_name).storage
+        names = [getattr(instance, field).name for field in ImageVariants.variant_fields(field_name).values()]
+        transaction.on_commit(partial(ImageVariants.delete_files, storage, names), using=using)
+
+    @staticmethod
+    def delete_files(storage, names):
+        for name in names:
+            if name:
+                storage.delete(name)
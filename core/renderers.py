@@ -0,0 +1,92 @@
+import codecs
+from decimal import Decimal
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser, get_encoding
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def require_orjson():
+    if orjson is None:
+        raise ImproperlyConfigured("JSON_RENDERER 'orjson' needs the orjson package: pip install orjson")
+
+
+PLAIN_TYPES = {str, int, bool, type(None)}
+
+
+def has_special_floats(data):
+    """
+    Tells whether the data holds a float, or a Decimal encoded as one, that is not finite or that
+    the stdlib writes in exponent form (1e+16, 1e-05) and orjson writes differently (1e16, 0.00001).
+    Both write the same digits for all other floats.
+    """
+    stack = [[data]]
+    while stack:
+        container = stack.pop()
+        for value in container.values() if isinstance(container, dict) else container:
+            if type(value) in PLAIN_TYPES:
+                continue
+            if isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+            elif isinstance(value, (float, Decimal)) and value != 0 and not 1e-4 <= abs(float(value)) < 1e16:
+                return True
+    return False
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson and produces the same bytes as DRF's stdlib renderer.
+    Datetimes, Decimals and other types orjson would format differently are passed to DRF's JSONEncoder.
+    Indented output, non-compact or ASCII-only settings, values orjson can not encode and data with floats
+    that are not finite or written in exponent form fall back to the stdlib renderer, which raises on
+    non-finite floats instead of writing them as null.
+    """
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def __init__(self):
+        require_orjson()
+        self.default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.ensure_ascii or not self.compact or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if has_special_floats(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like DRF, fully escape U+2028 and U+2029 so the output is a strict JavaScript subset.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser that decodes UTF-8 request bodies with orjson.
+    Other encodings and non-strict parsing fall back to DRF's stdlib parser.
+    """
+    renderer_class = ORJSONRenderer
+
+    def __init__(self):
+        require_orjson()
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        if not self.strict or codecs.lookup(get_encoding(parser_context)).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,48 @@
+from contextvars import ContextVar
+from django.conf import settings
+
+read_only_request = ContextVar('read_only_request', default=False)
+
+
+class ReadReplicaRouter:
+    """
+    Sends the reads of GET requests for offers, reviews and profiles to settings.READ_REPLICA_ALIAS.
+    ReadReplicaMiddleware marks those requests. Everything else, including all writes, uses the default database.
+    """
+    REPLICA_APPS = {'offers', 'reviews', 'auth_app'}
+
+    def db_for_read(self, model, **hints):
+        if read_only_request.get() and model._meta.app_label in self.REPLICA_APPS:
+            return settings.READ_REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        Objects from the replica and the default database may be related, since the replica mirrors the default one.
+        """
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == settings.READ_REPLICA_ALIAS:
+            return False
+        return None
+
+
+class ReadReplicaMiddleware:
+    """
+    Marks GET and HEAD requests as read-only for the ReadReplicaRouter while they are handled.
+    """
+    READ_ONLY_METHODS = {'GET', 'HEAD'}
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = read_only_request.set(request.method in self.READ_ONLY_METHODS)
+        try:
+            return self.get_response(request)
+        finally:
+            read_only_request.reset(token)
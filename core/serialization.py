@@ -0,0 +1,63 @@
+from rest_framework import serializers
+from rest_framework.response import Response
+
+
+class ValuesSerializer:
+    """
+    Read-only serializer for list endpoints that maps .values() rows straight to dicts.
+    Subclasses list their output fields in order and the subset read from the database as value_fields
+    (all fields by default). get_converters returns the per-field conversion applied to non-null values,
+    mirroring the to_representation of the matching DRF serializer.
+    The plan of (field, converter) pairs is compiled once per serializer instance.
+    """
+    fields = []
+    value_fields = None
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        converters = self.get_converters()
+        self.plan = [(field, converters.get(field)) for field in self.fields]
+
+    def get_converters(self):
+        return {}
+
+    def get_rows(self, queryset):
+        """
+        Turns the queryset into a .values() queryset of the output fields.
+        """
+        return queryset.prefetch_related(None).values(*(self.value_fields or self.fields))
+
+    def serialize(self, rows):
+        plan = self.plan
+        results = []
+        for row in rows:
+            item = {}
+            for field, convert in plan:
+                value = row[field]
+                item[field] = value if convert is None or value is None else convert(value)
+            results.append(item)
+        return results
+
+
+def datetime_converter():
+    """
+    Returns the to_representation of a DRF DateTimeField, so datetimes follow the DATETIME_FORMAT setting.
+    """
+    return serializers.DateTimeField().to_representation
+
+
+class ValuesListMixin:
+    """
+    Serves GET list requests through values_serializer_class instead of the model serializer.
+    Filtering and pagination work as before, on .values() rows instead of model instances.
+    """
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.values_serializer_class(context=self.get_serializer_context())
+        queryset = serializer.get_rows(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
@@ -50,6 +50,7 @@ INSTALLED_APPS = [
     'offers',
     'orders',
     'reviews',
+    'core',
 ]
 
 MIDDLEWARE = [
@@ -108,14 +109,109 @@ WSGI_APPLICATION = 'core.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# DB_ENGINE selects 'sqlite' (default) or 'postgresql'; see the README for all variables.
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+DB_POOL = os.environ.get('DB_POOL', 'false').lower() == 'true'
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'coderr'),
+            'USER': os.environ.get('DB_USER', 'coderr'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            # Django's connection pool and persistent connections exclude each other.
+            'CONN_MAX_AGE': 0 if DB_POOL else int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+                    'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+                    'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+                },
+            } if DB_POOL else {},
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # Writers take the lock when their transaction starts, so concurrent
+                # transactions wait for it (busy_timeout) instead of failing on upgrading a read lock.
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
 
-DATABASES = {
-    'default': {
+# Applied to every SQLite connection by core.db. WAL lets readers continue while a worker writes.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(float(os.environ.get('DB_TIMEOUT', 20)) * 1000),
+    'cache_size': -int(os.environ.get('DB_SQLITE_CACHE_KB', 20000)),
+    'mmap_size': int(os.environ.get('DB_SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+}
+
+# Optional read replica for GET requests on offers, reviews and profiles, see core.routers.
+# On SQLite DB_READ_REPLICA=true opens the database file a second time read-only;
+# on PostgreSQL DB_REPLICA_HOST names a streaming replica of the default database.
+READ_REPLICA_ALIAS = None
+
+if DB_ENGINE == 'postgresql' and os.environ.get('DB_REPLICA_HOST'):
+    READ_REPLICA_ALIAS = 'replica'
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.environ['DB_REPLICA_HOST'],
+        'PORT': os.environ.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+elif DB_ENGINE != 'postgresql' and os.environ.get('DB_READ_REPLICA', 'false').lower() == 'true':
+    READ_REPLICA_ALIAS = 'replica'
+    DATABASES['replica'] = {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': f"{Path(DATABASES['default']['NAME']).resolve().as_uri()}?mode=ro",
+        'TEST': {'MIRROR': 'default'},
+    }
+
+if READ_REPLICA_ALIAS:
+    DATABASE_ROUTERS = ['core.routers.ReadReplicaRouter']
+    MIDDLEWARE.append('core.routers.ReadReplicaMiddleware')
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'coderr'),
     }
 }
 
+# Writes invalidate cached offer list pages through a generation counter stored in the cache itself.
+# Other worker processes only see it in a shared cache; with the per-process LocMemCache,
+# pages are therefore kept for a few seconds only.
+OFFER_LIST_CACHE_ALIAS = 'default'
+OFFER_LIST_CACHE_TIMEOUT = 5 if CACHES[OFFER_LIST_CACHE_ALIAS]['BACKEND'].endswith('LocMemCache') else 300
+
+# Authenticated tokens are cached per process for a few seconds; set an alias to cache them in that
+# shared cache instead, where invalidations reach every process.
+TOKEN_AUTH_CACHE_ALIAS = os.environ.get('TOKEN_AUTH_CACHE_ALIAS') or None
+TOKEN_AUTH_CACHE_TIMEOUT = 60
+TOKEN_AUTH_CACHE_LOCAL_TIMEOUT = 5
+TOKEN_AUTH_CACHE_SIZE = 1024
+
+
+# Task queue for side effects that run after the commit: 'thread', 'sqlite' (durable) or 'immediate'.
+TASK_QUEUE_BACKEND = os.environ.get('TASK_QUEUE_BACKEND', 'thread')
+TASK_QUEUE_WORKERS = int(os.environ.get('TASK_QUEUE_WORKERS', 2))
+TASK_QUEUE_SQLITE_PATH = os.environ.get('TASK_QUEUE_SQLITE_PATH', os.path.join(BASE_DIR, 'tasks.sqlite3'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -154,6 +250,10 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = os.path.join(BASE_DIR, "static")
 
+# Uploaded images get a fixed-size (width, height) thumbnail and WebP variants, generated by the task queue.
+OFFER_THUMBNAIL_SIZE = (400, 300)
+PROFILE_THUMBNAIL_SIZE = (160, 160)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -166,7 +266,7 @@ REST_FRAMEWORK = {
     ], 
     
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.api.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     
@@ -179,3 +279,15 @@ REST_FRAMEWORK = {
 
     'DATETIME_FORMAT': "%Y-%m-%dT%H:%M:%SZ",
 }
+
+# JSON_RENDERER=orjson renders and parses JSON with orjson (pip install orjson), with unchanged output.
+if os.environ.get('JSON_RENDERER', 'stdlib') == 'orjson':
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = [
+        'core.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ]
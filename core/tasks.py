@@ -0,0 +1,267 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class ImmediateBackend:
+    """
+    Runs tasks right away in the calling thread and retries failed attempts without waiting.
+    Used in tests and wherever deferred work has to be finished before the request returns.
+    """
+
+    def submit(self, name, args, attempt=0):
+        while TaskQueue.execute(name, args, attempt)[0] is not None:
+            attempt += 1
+
+
+class ThreadPoolBackend:
+    """
+    Runs tasks in a pool of worker threads of the current process.
+    Retries are resubmitted by a timer after their backoff delay. Queued tasks are lost when the process exits.
+    """
+
+    def __init__(self, workers):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tasks")
+
+    def submit(self, name, args, attempt=0):
+        self.executor.submit(self.run, name, args, attempt)
+
+    def run(self, name, args, attempt):
+        try:
+            delay = TaskQueue.execute(name, args, attempt)[0]
+        finally:
+            close_old_connections()
+        if delay is not None:
+            timer = threading.Timer(delay, self.submit, (name, args, attempt + 1))
+            timer.daemon = True
+            timer.start()
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+class SQLiteBackend:
+    """
+    Durable queue stored in its own SQLite file, so queued and retried tasks survive restarts.
+    Worker threads claim tasks with a lease; tasks of a crashed process are picked up again once their lease ran out.
+    Finished tasks are deleted, tasks that failed their last attempt are kept with status 'failed' and the error.
+    Several processes may share the file.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            args TEXT NOT NULL,
+            attempt INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'pending',
+            run_at REAL NOT NULL,
+            locked_until REAL,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS tasks_status_run_at_idx ON tasks (status, run_at);
+    """
+    CLAIM = """
+        UPDATE tasks SET status = 'running', locked_until = :locked_until
+        WHERE id = (
+            SELECT id FROM tasks
+            WHERE (status = 'pending' AND run_at <= :now) OR (status = 'running' AND locked_until < :now)
+            ORDER BY run_at LIMIT 1
+        )
+        RETURNING id, name, args, attempt
+    """
+
+    def __init__(self, path, workers, poll_interval=1.0, lease=300):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(self.SCHEMA)
+        self.threads = [
+            threading.Thread(target=self.work, name=f"tasks-sqlite-{number}", daemon=True) for number in range(workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def submit(self, name, args, attempt=0):
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT INTO tasks (name, args, attempt, run_at) VALUES (?, ?, ?, ?)",
+                [name, json.dumps(args), attempt, time.time()]
+            )
+        self.wakeup.set()
+
+    def claim(self):
+        now = time.time()
+        with self.connect() as connection:
+            return connection.execute(self.CLAIM, {"now": now, "locked_until": now + self.lease}).fetchone()
+
+    def work(self):
+        while not self.stopped.is_set():
+            try:
+                task = self.claim()
+            except sqlite3.Error:
+                logger.exception("Could not claim a task from %s", self.path)
+                task = None
+            if task is None:
+                self.wakeup.wait(self.poll_interval)
+                self.wakeup.clear()
+                continue
+            self.run(*task)
+
+    def run(self, task_id, name, args, attempt):
+        try:
+            delay, error = TaskQueue.execute(name, json.loads(args), attempt)
+        finally:
+            close_old_connections()
+
+        with self.connect() as connection:
+            if delay is not None:
+                connection.execute(
+                    "UPDATE tasks SET status = 'pending', attempt = ?, run_at = ?, locked_until = NULL WHERE id = ?",
+                    [attempt + 1, time.time() + delay, task_id]
+                )
+            elif error is not None:
+                connection.execute("UPDATE tasks SET status = 'failed', error = ? WHERE id = ?", [error, task_id])
+            else:
+                connection.execute("DELETE FROM tasks WHERE id = ?", [task_id])
+
+    def stop(self, timeout=None):
+        self.stopped.set()
+        self.wakeup.set()
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def counts(self):
+        with self.connect() as connection:
+            return dict(connection.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+
+
+class TaskQueue:
+    """
+    Small task queue for side effects that do not have to finish inside the request, like image variants
+    or stats reconciles. Tasks are plain functions registered under a name with TaskQueue.task
+    and enqueued with JSON-serializable arguments; they run once the current transaction commits.
+    The backend is chosen with TASK_QUEUE_BACKEND: 'thread' (default), 'sqlite' (durable) or 'immediate'.
+    Failed attempts are retried with exponential backoff; per-task metrics are kept in-process.
+    """
+    BACKENDS = ("immediate", "thread", "sqlite")
+
+    tasks = {}
+    metrics = defaultdict(lambda: {"enqueued": 0, "succeeded": 0, "retried": 0, "failed": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+    _backends = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def task(name, retries=0, retry_delay=1.0):
+        """
+        Registers the decorated function as a task. A failing task is attempted up to `retries` more times,
+        waiting retry_delay seconds before the first retry and twice as long before each further one.
+        """
+        def register(func):
+            TaskQueue.tasks[name] = (func, retries, retry_delay)
+            return func
+        return register
+
+    @staticmethod
+    def enqueue(name, *args, using="default"):
+        """
+        Queues the task with the given arguments once the transaction on `using` commits, or right away outside of one.
+        The arguments are passed through JSON with every backend, as the durable one stores them that way.
+        """
+        if name not in TaskQueue.tasks:
+            raise KeyError(f"Unknown task {name!r}.")
+        args = json.loads(json.dumps(args))
+        transaction.on_commit(partial(TaskQueue.submit, name, args), using=using)
+
+    @staticmethod
+    def submit(name, args):
+        """
+        Hands the task to the backend and counts it as enqueued.
+        Runs after the commit, so a backend that can not take the task is logged instead of failing the committed write.
+        """
+        with TaskQueue._lock:
+            TaskQueue.metrics[name]["enqueued"] += 1
+        try:
+            TaskQueue.get_backend().submit(name, args)
+        except Exception:
+            logger.exception("Could not queue task %s", name)
+
+    @staticmethod
+    def execute(name, args, attempt=0):
+        """
+        Runs one attempt of a task and records its metrics.
+        Returns the delay before the next attempt, or None if there is none, and the error of a failed attempt.
+        """
+        if name not in TaskQueue.tasks:
+            logger.error("Unknown task %s", name)
+            return None, f"Unknown task {name!r}."
+        func, retries, retry_delay = TaskQueue.tasks[name]
+        started = time.perf_counter()
+        try:
+            func(*args)
+        except Exception as exception:
+            failed = attempt >= retries
+            logger.warning("Task %s failed on attempt %s", name, attempt + 1, exc_info=failed)
+            outcome, error = ("failed" if failed else "retried"), repr(exception)
+            delay = None if failed else retry_delay * 2 ** attempt
+        else:
+            outcome, delay, error = "succeeded", None, None
+
+        seconds = time.perf_counter() - started
+        with TaskQueue._lock:
+            metrics = TaskQueue.metrics[name]
+            metrics[outcome] += 1
+            metrics["total_seconds"] += seconds
+            metrics["max_seconds"] = max(metrics["max_seconds"], seconds)
+        return delay, error
+
+    @staticmethod
+    def get_metrics():
+        """
+        Returns a snapshot of the per-task counters and run times of this process.
+        """
+        with TaskQueue._lock:
+            return {name: dict(metrics) for name, metrics in TaskQueue.metrics.items()}
+
+    @staticmethod
+    def get_backend():
+        """
+        Returns the backend selected by TASK_QUEUE_BACKEND, created on first use.
+        """
+        name = settings.TASK_QUEUE_BACKEND
+        with TaskQueue._lock:
+            if name not in TaskQueue._backends:
+                TaskQueue._backends[name] = TaskQueue.create_backend(name)
+            return TaskQueue._backends[name]
+
+    @staticmethod
+    def create_backend(name):
+        if name == "immediate":
+            return ImmediateBackend()
+        if name == "thread":
+            return ThreadPoolBackend(settings.TASK_QUEUE_WORKERS)
+        if name == "sqlite":
+            return SQLiteBackend(settings.TASK_QUEUE_SQLITE_PATH, settings.TASK_QUEUE_WORKERS)
+        raise ImproperlyConfigured(f"TASK_QUEUE_BACKEND must be one of {', '.join(TaskQueue.BACKENDS)}, not {name!r}.")
@@ -0,0 +1,61 @@
+from unittest import skipUnless
+from django.conf import settings
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from auth_app.models import UserProfile
+from core.routers import ReadReplicaMiddleware, ReadReplicaRouter, read_only_request
+from offers.models import Offer
+from orders.models import Order
+from reviews.models import Review
+
+
+@skipUnless(connection.vendor == "sqlite", "The pragmas only apply to SQLite connections.")
+class SqlitePragmaTest(TestCase):
+
+    def get_pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas_applied_to_connection(self):
+        self.assertEqual(self.get_pragma("synchronous"), 1)
+        self.assertEqual(self.get_pragma("busy_timeout"), settings.SQLITE_PRAGMAS["busy_timeout"])
+        self.assertEqual(self.get_pragma("cache_size"), settings.SQLITE_PRAGMAS["cache_size"])
+
+
+@override_settings(READ_REPLICA_ALIAS="replica")
+class ReadReplicaRouterTest(SimpleTestCase):
+
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+
+    def read_with_flag(self, model, read_only):
+        token = read_only_request.set(read_only)
+        try:
+            return self.router.db_for_read(model)
+        finally:
+            read_only_request.reset(token)
+
+    def test_get_reads_of_offers_reviews_and_profiles_use_replica(self):
+        for model in (Offer, Review, UserProfile):
+            self.assertEqual(self.read_with_flag(model, True), "replica")
+
+    def test_other_reads_use_default(self):
+        self.assertIsNone(self.read_with_flag(Order, True))
+        self.assertIsNone(self.read_with_flag(Offer, False))
+
+    def test_writes_and_migrations_stay_on_default(self):
+        self.assertIsNone(self.router.db_for_write(Offer))
+        self.assertFalse(self.router.allow_migrate("replica", "offers"))
+        self.assertIsNone(self.router.allow_migrate("default", "offers"))
+
+    def test_middleware_marks_only_get_requests(self):
+        seen = []
+        middleware = ReadReplicaMiddleware(lambda request: seen.append(read_only_request.get()))
+        factory = RequestFactory()
+
+        middleware(factory.get("/api/offers/"))
+        middleware(factory.post("/api/offers/"))
+
+        self.assertEqual(seen, [True, False])
+        self.assertFalse(read_only_request.get())
@@ -0,0 +1,71 @@
+import re
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from auth_app.models import UserProfile
+from orders.models import Order
+from reviews.models import Review
+
+
+@skipUnless(connection.vendor == "sqlite", "Query plan assertions are written against SQLite's EXPLAIN QUERY PLAN output.")
+class HotQueryPlanTest(TestCase):
+
+    business_user_id = 1
+    customer_user_id = 2
+
+    def assertUsesIndex(self, queryset, table):
+        """
+        Asserts that every plan step on the table searches an index instead of scanning.
+        """
+        plan = queryset.explain()
+        steps = [line for line in plan.splitlines() if re.search(rf"\b{table}\b", line)]
+        self.assertTrue(steps, plan)
+        for step in steps:
+            self.assertRegex(step, rf"SEARCH {table} USING (COVERING )?INDEX", plan)
+
+    def test_order_list_page_searches_each_side_up_to_the_page_size(self):
+        user = User.objects.create_user(username="customer", password="testpassword")
+        other_user = User.objects.create_user(username="business", password="testpassword")
+        for customer_user, business_user in ((user, other_user), (other_user, user), (user, other_user)):
+            Order.objects.create(
+                customer_user=customer_user, business_user=business_user, title="Logo", revisions=1,
+                delivery_time_in_days=1, price=10, features=[], offer_type="basic"
+            )
+        client = APIClient()
+        client.force_authenticate(user=user)
+        next_url = client.get(reverse('order-list'), {'page_size': 1}).data["next"]
+
+        with CaptureQueriesContext(connection) as queries:
+            client.get(next_url)
+        sql = queries.captured_queries[-1]["sql"]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            plan = "\n".join(row[-1] for row in cursor.fetchall())
+
+        self.assertRegex(plan, r"SEARCH \w+ USING INDEX order_customer_created_idx \(customer_user_id=\? AND created_at<\?\)")
+        self.assertRegex(plan, r"SEARCH \w+ USING INDEX order_business_created_idx \(business_user_id=\? AND created_at<\?\)")
+        self.assertEqual(len(re.findall(r"LIMIT", sql)), 3, sql)
+        self.assertRegex(plan, r"SEARCH orders_order USING INTEGER PRIMARY KEY \(rowid=\?\)")
+        self.assertNotRegex(plan, r"\bSCAN\b|MULTI-INDEX OR")
+        self.assertNotIn("UNION USING TEMP B-TREE", plan)
+        self.assertEqual(plan.count("TEMP B-TREE"), 1, plan)
+
+    def test_completed_order_lookup_uses_index(self):
+        queryset = Order.objects.filter(customer_user_id=self.customer_user_id, business_user_id=self.business_user_id, status="completed")
+        self.assertUsesIndex(queryset, "orders_order")
+
+    def test_business_order_status_lookup_uses_index(self):
+        self.assertUsesIndex(Order.objects.filter(business_user_id=self.business_user_id, status="completed"), "orders_order")
+
+    def test_duplicate_review_lookup_uses_index(self):
+        self.assertUsesIndex(Review.objects.filter(reviewer_id=self.customer_user_id, business_user_id=self.business_user_id), "reviews_review")
+
+    def test_review_business_user_filter_uses_index(self):
+        self.assertUsesIndex(Review.objects.filter(business_user_id=self.business_user_id), "reviews_review")
+
+    def test_profile_type_filter_uses_index(self):
+        self.assertUsesIndex(UserProfile.objects.filter(type="business"), "auth_app_userprofile")
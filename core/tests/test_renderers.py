@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import skipUnless
+from uuid import UUID
+from io import BytesIO
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from core import renderers
+from core.renderers import ORJSONRenderer, ORJSONParser
+from orders.api.serializers import OrderSerializer
+from orders.models import Order
+
+
+@skipUnless(renderers.orjson, "orjson is not installed.")
+class ORJSONRendererTest(SimpleTestCase):
+
+    def assertSameOutput(self, data, accepted_media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type)
+        )
+
+    def test_output_matches_json_renderer(self):
+        self.assertSameOutput({
+            "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "naive": datetime(2025, 1, 2, 3, 4, 5),
+            "price": Decimal("150.50"),
+            "features": ["Logo", "Ünïcode", "line\u2028separator\u2029"],
+            "nested": {"rating": 4.5, "none": None, "flag": True, 1: "int key"},
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "message": gettext_lazy("This field is required."),
+            "big": 2 ** 70,
+        })
+
+    def test_exponent_floats_match_json_renderer(self):
+        self.assertSameOutput({
+            "large": [1e16, -1e16, 1.7976931348623157e308, 9999999999999998.0],
+            "small": [1e-5, 1e-7, -5e-324, 0.0001, 0.0, -0.0],
+            "decimals": [Decimal("1E+16"), Decimal("1E-7")],
+        })
+
+    def test_non_finite_floats_raise_like_json_renderer(self):
+        for value in (float("nan"), float("inf"), -float("inf"), Decimal("NaN")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({"rating": value})
+                with self.assertRaises(ValueError):
+                    ORJSONRenderer().render({"rating": value})
+
+    def test_indented_output_matches_json_renderer(self):
+        self.assertSameOutput({"features": ["Logo"]}, "application/json; indent=4")
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+@skipUnless(renderers.orjson, "orjson is not installed.")
+class ORJSONParserTest(SimpleTestCase):
+
+    def parse(self, parser, body, encoding="utf-8"):
+        return parser.parse(BytesIO(body), parser_context={"encoding": encoding})
+
+    def test_parse_matches_json_parser(self):
+        body = '{"details": [{"price": 150.5, "features": ["Ünïcode"]}], "id": 1}'.encode()
+        self.assertEqual(self.parse(ORJSONParser(), body), self.parse(JSONParser(), body))
+
+    def test_other_encodings_fall_back(self):
+        body = '{"title": "Ünïcode"}'.encode("utf-16")
+        self.assertEqual(self.parse(ORJSONParser(), body, "utf-16"), {"title": "Ünïcode"})
+
+    def test_invalid_json_raises_parse_error(self):
+        for body in (b'{"price": NaN}', b'{"price":'):
+            with self.assertRaises(ParseError):
+                self.parse(ORJSONParser(), body)
+
+
+@skipUnless(renderers.orjson, "orjson is not installed.")
+class ORJSONOrderListTest(APITestCase):
+
+    def test_order_list_matches_json_renderer(self):
+        customer = User.objects.create_user(username="customer", password="testpassword")
+        business = User.objects.create_user(username="business", password="testpassword")
+        order = Order.objects.create(
+            customer_user=customer, business_user=business, title="Logo", revisions=2,
+            delivery_time_in_days=3, price="150.50", features=["Logo", "Ünïcode"], offer_type="basic"
+        )
+        data = OrderSerializer([order], many=True).data
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
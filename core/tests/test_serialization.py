@@ -0,0 +1,65 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase, APIClient
+from auth_app.models import UserProfile
+from offers.api.serilizers import OfferSerializer
+from offers.models import Offer, OfferDetails
+from orders.api.serializers import OrderSerializer
+from orders.models import Order
+from reviews.api.serializers import ReviewSerializer
+from reviews.models import Review
+
+
+class ValuesSerializerParityTest(APITestCase):
+    """
+    Compares the rendered JSON of the .values() list serializers with the model serializers they replace.
+    """
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username="business", password="testpassword")
+        self.customer_user = User.objects.create_user(username="customer", password="testpassword")
+        UserProfile.objects.create(user=self.business_user, type="business")
+        UserProfile.objects.create(user=self.customer_user, type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_user)
+
+        offer = Offer.objects.create(
+            user=self.business_user, title="Logo", description="Logo Design", image="offers_pics/logo.png"
+        )
+        for offer_type, price in [("basic", 49.99), ("standard", 120), ("premium", 250.5)]:
+            OfferDetails.objects.create(
+                offer=offer, title=offer_type, revisions=-1 if offer_type == "premium" else 2,
+                delivery_time_in_days=3, price=price, features=["Logo", "Ünïcode"], offer_type=offer_type
+            )
+        offer.apply_min_values(offer.details.all())
+        offer.save()
+        Offer.objects.create(user=self.business_user, title="Empty", description="Without details")
+
+        for price, status in [("150.50", "in_progress"), ("99.00", "completed")]:
+            Order.objects.create(
+                customer_user=self.customer_user, business_user=self.business_user, title="Logo",
+                revisions=2, delivery_time_in_days=3, price=price, features=["Logo"],
+                offer_type="basic", status=status
+            )
+        Review.objects.create(business_user=self.business_user, reviewer=self.customer_user, rating=4, description="Good \"work\"")
+
+    def assertParity(self, url, model_serializer, queryset):
+        response = self.client.get(url)
+        results = response.data["results"]
+        instances = {instance.id: instance for instance in queryset}
+        expected = model_serializer(
+            [instances[row["id"]] for row in results], many=True, context={"request": response.wsgi_request}
+        ).data
+
+        self.assertEqual(len(results), len(instances))
+        self.assertEqual(JSONRenderer().render(results), JSONRenderer().render(expected))
+
+    def test_offer_list_parity(self):
+        self.assertParity(reverse('offer-list'), OfferSerializer, Offer.objects.prefetch_related('details'))
+
+    def test_order_list_parity(self):
+        self.assertParity(reverse('order-list'), OrderSerializer, Order.objects.all())
+
+    def test_review_list_parity(self):
+        self.assertParity(reverse('review-list'), ReviewSerializer, Review.objects.all())
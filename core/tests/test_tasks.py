@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from core.tasks import SQLiteBackend, TaskQueue, ThreadPoolBackend
+
+calls = []
+
+
+@TaskQueue.task("tests.record")
+def record(value):
+    calls.append(value)
+
+
+@TaskQueue.task("tests.flaky", retries=2, retry_delay=0)
+def flaky(failures):
+    calls.append(failures)
+    if calls.count(failures) <= failures:
+        raise ValueError("Not yet.")
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@override_settings(TASK_QUEUE_BACKEND="immediate")
+class TaskQueueTest(TestCase):
+
+    def setUp(self):
+        calls.clear()
+        TaskQueue.metrics.clear()
+
+    def test_task_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TaskQueue.enqueue("tests.record", {"id": 1})
+            self.assertEqual(calls, [])
+
+        self.assertEqual(calls, [{"id": 1}])
+
+    def test_rolled_back_task_does_not_run(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                TaskQueue.enqueue("tests.record", 1)
+                transaction.set_rollback(True)
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(calls, [])
+        self.assertNotIn("tests.record", TaskQueue.get_metrics())
+
+    def test_backend_errors_do_not_fail_the_write(self):
+        with mock.patch.object(TaskQueue, "get_backend", side_effect=OSError("Queue file is not writable.")):
+            with self.assertLogs("core.tasks", "ERROR"), self.captureOnCommitCallbacks(execute=True):
+                TaskQueue.enqueue("tests.record", 1)
+
+        self.assertEqual(calls, [])
+
+    def test_failed_attempts_are_retried(self):
+        with self.assertLogs("core.tasks", "WARNING") as logs, self.captureOnCommitCallbacks(execute=True):
+            TaskQueue.enqueue("tests.flaky", 2)
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(calls, [2, 2, 2])
+        metrics = TaskQueue.get_metrics()["tests.flaky"]
+        self.assertEqual((metrics["enqueued"], metrics["retried"], metrics["succeeded"], metrics["failed"]), (1, 2, 1, 0))
+
+    def test_task_fails_after_its_last_retry(self):
+        with self.assertLogs("core.tasks", "WARNING"), self.captureOnCommitCallbacks(execute=True):
+            TaskQueue.enqueue("tests.flaky", 5)
+
+        self.assertEqual(calls, [5, 5, 5])
+        self.assertEqual(TaskQueue.get_metrics()["tests.flaky"]["failed"], 1)
+
+    def test_arguments_must_be_serializable(self):
+        with self.assertRaises(TypeError):
+            TaskQueue.enqueue("tests.record", object())
+        with self.assertRaises(KeyError):
+            TaskQueue.enqueue("tests.unknown")
+
+
+class TaskBackendTest(SimpleTestCase):
+
+    def setUp(self):
+        calls.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path = os.path.join(self.directory, "tasks.sqlite3")
+
+    def start_sqlite_backend(self, workers=1):
+        backend = SQLiteBackend(self.path, workers, poll_interval=0.01)
+        self.addCleanup(backend.stop)
+        return backend
+
+    def test_thread_pool_backend_runs_and_retries_tasks(self):
+        backend = ThreadPoolBackend(workers=2)
+        with self.assertLogs("core.tasks", "WARNING"):
+            backend.submit("tests.record", ["a"])
+            backend.submit("tests.flaky", [1])
+            self.assertTrue(wait_for(lambda: calls.count(1) == 2))
+        backend.shutdown()
+        self.assertIn("a", calls)
+
+    def test_sqlite_backend_keeps_tasks_until_a_worker_runs_them(self):
+        self.start_sqlite_backend(workers=0).submit("tests.record", ["durable"])
+
+        backend = self.start_sqlite_backend()
+
+        self.assertTrue(wait_for(lambda: calls == ["durable"]))
+        self.assertTrue(wait_for(lambda: backend.counts() == {}))
+
+    def test_sqlite_backend_retries_and_keeps_failed_tasks(self):
+        backend = self.start_sqlite_backend()
+        with self.assertLogs("core.tasks", "WARNING"):
+            backend.submit("tests.flaky", [1])
+            backend.submit("tests.flaky", [3])
+            self.assertTrue(wait_for(lambda: backend.counts() == {"failed": 1}))
+
+        self.assertEqual(calls.count(1), 2)
+        self.assertEqual(calls.count(3), 3)
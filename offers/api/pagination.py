@@ -1,4 +1,12 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import replace_query_param
+from offers.models import Offer
+from offers.offers_ordering.offers_ordering import OrderingHelperOffers
 
 class StandardResultsSetPagination(PageNumberPagination):
     """
@@ -7,4 +15,99 @@ class StandardResultsSetPagination(PageNumberPagination):
     """
     page_size = 6
     page_size_query_param = 'page_size'
-    max_page_size = 100
\ No newline at end of file
+    max_page_size = 100
+
+
+class OfferCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the offer list, keyed on the OrderingHelperOffers ordering with an id tiebreaker.
+    The cursor holds the ordering value and the id of the row it points at. A page is read from at most three
+    index range scans: the rest of the current group of equal values, the rows beyond it and the rows without
+    a value. Deep pages therefore cost the same as the first one, also inside large groups of equal prices,
+    and there is no COUNT query and no OFFSET.
+    Offers without a value for the ordering field, e.g. offers without details and thus without min_price,
+    come after all other offers in both directions, ordered by id.
+    Searches need an explicit ordering, because the relevance rank can not serve as a cursor.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        return OrderingHelperOffers.get_ordering(request.query_params.get('ordering'))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if params.get('search') and params.get('ordering') not in OrderingHelperOffers.ORDERING_OPTIONS:
+            raise ValidationError({"ordering": ["Cursor pagination of search results needs an explicit ordering."]})
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        ordering = self.get_ordering(request, queryset, view)[0]
+        self.field, self.descending = ordering.lstrip('-'), ordering.startswith('-')
+        position, reverse = self.decode_position(request)
+
+        rows = []
+        for segment in self.get_segments(queryset, position, reverse):
+            rows += segment[:self.page_size + 1 - len(rows)]
+            if len(rows) > self.page_size:
+                break
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next, has_previous = (position is not None, has_more) if reverse else (has_more, position is not None)
+        self.next_link = self.encode_position(rows[-1], False) if rows and has_next else None
+        self.previous_link = self.encode_position(rows[0], True) if rows and has_previous else None
+        return rows
+
+    def get_segments(self, queryset, position, reverse):
+        """
+        Returns the querysets that follow the position in the page direction, in the order they are read.
+        """
+        field = self.field
+        step = "lt" if self.descending != reverse else "gt"
+        direction = "-" if self.descending != reverse else ""
+        ordering = (f"{direction}{field}", f"{direction}id")
+        with_value = queryset.filter(**{f"{field}__isnull": False}).order_by(*ordering)
+        without_value = queryset.filter(**{f"{field}__isnull": True}).order_by(ordering[1])
+
+        if position is None:
+            return [with_value, without_value]
+        value, pk = position
+        if value is None:
+            rest = without_value.filter(**{f"id__{step}": pk})
+            return [rest, with_value] if reverse else [rest]
+        ties = with_value.filter(**{field: value, f"id__{step}": pk})
+        beyond = with_value.filter(**{f"{field}__{step}": value})
+        return [ties, beyond] if reverse else [ties, beyond, without_value]
+
+    def encode_position(self, row, reverse):
+        value = row[self.field] if isinstance(row, dict) else getattr(row, self.field)
+        pk = row["id"] if isinstance(row, dict) else row.pk
+        data = json.dumps({"v": value, "i": pk, "r": reverse}, cls=JSONEncoder)
+        return replace_query_param(self.base_url, self.cursor_query_param, urlsafe_b64encode(data.encode()).decode())
+
+    def decode_position(self, request):
+        """
+        Returns the (value, id) position of the cursor, None without a cursor, and whether to page backwards.
+        Raises NotFound for malformed cursors.
+        """
+        if (encoded := request.query_params.get(self.cursor_query_param)) is None:
+            return None, False
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode()))
+            value = data["v"]
+            if value is not None:
+                value = Offer._meta.get_field(self.field).to_python(value)
+            return (value, int(data["i"])), bool(data["r"])
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        return self.next_link
+
+    def get_previous_link(self):
+        return self.previous_link
@@ -1,12 +1,95 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import router, transaction
 from rest_framework import serializers
+from core.serialization import ValuesSerializer, datetime_converter
 from offers.models import Offer, OfferDetails
+from offers.signals import offers_bulk_created
+
+
+DETAIL_UPDATE_FIELDS = ("title", "revisions", "delivery_time_in_days", "price", "features")
+
+
+def to_detail_value(field_name, value):
+    """
+    Converts a raw request value for an OfferDetails field the way the database returns it,
+    so details can be serialized without reloading them. Raises a ValidationError for invalid values.
+    """
+    try:
+        return OfferDetails._meta.get_field(field_name).to_python(value)
+    except DjangoValidationError as error:
+        raise serializers.ValidationError({"details": {field_name: error.messages}})
+
+
+def build_offer_details(offer, details_data):
+    """
+    Builds unsaved OfferDetails for the offer from the raw request data.
+    """
+    details = []
+    for detail_data in details_data:
+        detail = OfferDetails(offer=offer, **detail_data)
+        for field_name in ("revisions", "delivery_time_in_days", "price"):
+            setattr(detail, field_name, to_detail_value(field_name, getattr(detail, field_name)))
+        details.append(detail)
+    return details
+
+
+def apply_detail_changes(detail, detail_data):
+    """
+    Sets the updatable fields from the raw request data on an existing detail.
+    Returns the names of the fields whose value actually changed.
+    """
+    changed_fields = set()
+    for field_name in DETAIL_UPDATE_FIELDS:
+        if field_name not in detail_data:
+            continue
+        value = to_detail_value(field_name, detail_data[field_name])
+        if getattr(detail, field_name) != value:
+            setattr(detail, field_name, value)
+            changed_fields.add(field_name)
+    return changed_fields
+
+
+class OfferListSerializer(serializers.ListSerializer):
+    """
+    List serializer for creating many offers at once.
+    Inserts all offers and all of their details with two bulk_create calls inside one transaction.
+    """
+
+    def run_child_validation(self, data):
+        self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def create(self, validated_data):
+        """
+        Bulk-creates the offers and their details, linking the current user automatically,
+        and sends offers_bulk_created for the bookkeeping the skipped save signals would do.
+        """
+        user = self.context.get("request").user
+        offers, details = [], []
+        for offer_data, initial_data in zip(validated_data, self.initial_data):
+            offer = Offer(user=user, **offer_data)
+            offer_details = build_offer_details(offer, initial_data.get("details", []))
+            offer.apply_min_values(offer_details)
+            offers.append(offer)
+            details.append(offer_details)
+
+        using = router.db_for_write(Offer)
+        with transaction.atomic(using=using):
+            Offer.objects.using(using).bulk_create(offers)
+            OfferDetails.objects.using(using).bulk_create([detail for offer_details in details for detail in offer_details])
+            offers_bulk_created.send(sender=Offer, offers=offers, using=using)
+
+        for offer, offer_details in zip(offers, details):
+            offer.cache_details(offer_details)
+        return offers
 
 
 class OfferSerializer(serializers.ModelSerializer):
     """
     Serializer for the Offer model including nested OfferDetails.
     Handles creation, update, and validation of exactly three details (basic, standard, premium).
-    Provides read-only aggregated fields like min_price and min_delivery_time.
+    Provides the stored read-only fields min_price and min_delivery_time, kept in sync with the details,
+    and the read-only URLs of the image's thumbnail and WebP variants.
     """
     min_price = serializers.FloatField(read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -18,6 +101,9 @@ class OfferSerializer(serializers.ModelSerializer):
             'user', 
             'title', 
             'image', 
+            'image_thumbnail',
+            'image_thumbnail_webp',
+            'image_webp',
             'description', 
             'created_at', 
             'updated_at', 
@@ -26,8 +112,15 @@ class OfferSerializer(serializers.ModelSerializer):
             'min_delivery_time'
         ]
         read_only_fields = ['user']
+        list_serializer_class = OfferListSerializer
 
     def get_details(self, obj):
+        """
+        Serializes the details the offer was just saved with, if any, and the 'details' relation otherwise.
+        """
+        details = getattr(obj, 'loaded_details', None)
+        if details is None:
+            details = obj.details.all()
         return [
             {
                 "id": detail.id,
@@ -39,23 +132,27 @@ class OfferSerializer(serializers.ModelSerializer):
                 "offer_type": detail.offer_type,
                 "url": f"/offerdetails/{detail.id}/" 
             }
-            for detail in obj.details.all()
+            for detail in details
         ]
 
 
     def create(self, validated_data):
         """
-        Creates an Offer and its nested OfferDetails, linking the current user automatically.
+        Creates an Offer and its nested OfferDetails in one transaction, linking the current user automatically.
+        Inserts the details with a single bulk_create and stores min_price and min_delivery_time up front.
         """
         request = self.context.get("request")
         validated_data["user"] = request.user  
 
-        details_data = self.initial_data.get("details", [])
-        offer = Offer.objects.create(**validated_data)
+        offer = Offer(**validated_data)
+        details = build_offer_details(offer, self.initial_data.get("details", []))
+        offer.apply_min_values(details)
 
-        for detail_data in details_data:
-            OfferDetails.objects.create(offer=offer, **detail_data)
+        with transaction.atomic():
+            offer.save()
+            OfferDetails.objects.bulk_create(details)
 
+        offer.cache_details(details)
         return offer
 
     def validate(self, data):
@@ -90,29 +187,91 @@ class OfferSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         """
         Updates an Offer and partially updates its nested OfferDetails if provided.
+        Loads the existing details once, writes only the changed fields with bulk_update
+        and saves the refreshed min_price and min_delivery_time together with the offer, all in one transaction.
         """
         details_data = self.initial_data.get("details", None)
-        offer = super().update(instance, validated_data)
-
-        if details_data is not None:
-            for detail_data in details_data:
-                offer_type = detail_data.get("offer_type")
-                if not offer_type:
-                    continue
-
-                detail_obj = offer.details.filter(offer_type=offer_type).first()
-                if detail_obj:
-                    for field, value in detail_data.items():
-                        if field not in ["id", "offer_type", "offer"]:
-                            setattr(detail_obj, field, value)
-                    detail_obj.save()
-                else:
-                    detail_data.pop("offer", None)
-                    OfferDetails.objects.create(offer=offer, **detail_data)
+        if details_data is None:
+            return super().update(instance, validated_data)
+
+        details = {detail.offer_type: detail for detail in instance.details.all()}
+        changed_details, changed_fields, new_details = [], set(), []
+        for detail_data in details_data:
+            offer_type = detail_data.get("offer_type")
+            if not offer_type:
+                continue
 
+            detail_obj = details.get(offer_type)
+            if detail_obj:
+                if (detail_fields := apply_detail_changes(detail_obj, detail_data)):
+                    changed_details.append(detail_obj)
+                    changed_fields |= detail_fields
+            else:
+                detail_data = {field: value for field, value in detail_data.items() if field not in ["id", "offer"]}
+                detail_obj, = build_offer_details(instance, [detail_data])
+                details[offer_type] = detail_obj
+                new_details.append(detail_obj)
+
+        instance.apply_min_values(details.values())
+        with transaction.atomic():
+            if changed_details:
+                OfferDetails.objects.bulk_update(changed_details, sorted(changed_fields))
+            if new_details:
+                OfferDetails.objects.bulk_create(new_details)
+            offer = super().update(instance, validated_data)
+
+        offer.cache_details(details.values())
         return offer
     
     
+class OfferValuesSerializer(ValuesSerializer):
+    """
+    Read-only list serializer producing the same output as OfferSerializer from .values() rows.
+    The details of all offers on a page are loaded with one further .values() query.
+    """
+    fields = OfferSerializer.Meta.fields
+    value_fields = [field for field in fields if field != 'details']
+    detail_fields = ['id', 'offer_id', 'title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']
+
+    def get_converters(self):
+        request = self.context.get('request')
+        storage = Offer._meta.get_field('image').storage
+
+        def image(name):
+            if not name:
+                return None
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+
+        return {
+            'image': image,
+            'image_thumbnail': image,
+            'image_thumbnail_webp': image,
+            'image_webp': image,
+            'created_at': datetime_converter(),
+            'updated_at': datetime_converter(),
+            'min_price': float,
+        }
+
+    def serialize(self, rows):
+        rows = list(rows)
+        details = {row['id']: [] for row in rows}
+        for detail in OfferDetails.objects.filter(offer_id__in=details).values(*self.detail_fields):
+            details[detail['offer_id']].append({
+                "id": detail['id'],
+                "title": detail['title'],
+                "revisions": detail['revisions'],
+                "delivery_time_in_days": detail['delivery_time_in_days'],
+                "price": detail['price'],
+                "features": detail['features'] or [],
+                "offer_type": detail['offer_type'],
+                "url": f"/offerdetails/{detail['id']}/"
+            })
+        for row in rows:
+            row['details'] = details[row['id']]
+        return super().serialize(rows)
+
+
 class OfferDetailSerializer(serializers.ModelSerializer):
     """
     Serializer for the OfferDetails model.
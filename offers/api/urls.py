@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import OfferListCreateView, OfferDetailView, OfferDetailOverviewView
+from .views import OfferListCreateView, OfferDetailView, OfferDetailOverviewView, OfferBatchCreateView
 
 urlpatterns = [
     path('offers/', OfferListCreateView.as_view(), name='offer-list'),
+    path('offers/batch/', OfferBatchCreateView.as_view(), name='offer-batch'),
     path('offers/<int:pk>/', OfferDetailView.as_view(), name='offer-details'),
     path('offerdetails/<int:pk>/', OfferDetailOverviewView.as_view(), name='detail-overview'),
-]
\ No newline at end of file
+]
@@ -1,28 +1,48 @@
-from django.db.models import Q
-from django.db.models import Min
+from django.db.models import F, prefetch_related_objects
 from django.shortcuts import get_object_or_404
 from rest_framework import status, generics
 from rest_framework.generics import ListCreateAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.exceptions import ValidationError
-from .pagination import StandardResultsSetPagination
+from core.conditional import check_conditions, content_digest, make_etag, set_validators
+from core.serialization import ValuesListMixin
+from .pagination import StandardResultsSetPagination, OfferCursorPagination
+from offers.offers_cache.offers_cache import OfferListCache
 from offers.offers_ordering.offers_ordering import OrderingHelperOffers
+from offers.offers_search.offers_search import SearchHelperOffers
 from offers.models import Offer,OfferDetails
-from .serilizers import OfferSerializer, OfferDetailSerializer
-from auth_app.models import UserProfile
+from .serilizers import OfferSerializer, OfferDetailSerializer, OfferValuesSerializer
+from auth_app.api.authentication import get_request_profile
 
 
-class OfferListCreateView(ListCreateAPIView):
+class OfferListCreateView(ValuesListMixin, ListCreateAPIView):
     """
     API view for listing all offers and creating new ones.
-    Supports filtering, search, ordering, and annotated fields like min_price and min_delivery_time.
+    Supports filtering, search, ordering, and the stored fields min_price and min_delivery_time.
+    Paginates by page number, or by cursor when requested with ?pagination=cursor.
+    List responses are built from .values() rows by OfferValuesSerializer and cached per query string until the next offer write.
+    Their ETag is a digest of the cached page, so unchanged lists are answered with 304.
     Creation is restricted to authenticated business users only.
     """
     serializer_class = OfferSerializer
+    values_serializer_class = OfferValuesSerializer
     pagination_class = StandardResultsSetPagination
 
+    @property
+    def paginator(self):
+        """
+        Returns the cursor paginator for ?pagination=cursor requests, the page-number paginator otherwise.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = OfferCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_permissions(self):
         """
         Returns authentication permissions based on request method:
@@ -33,30 +53,41 @@ class OfferListCreateView(ListCreateAPIView):
             return [IsAuthenticated()]
         return [AllowAny()]
 
+    def list(self, request, *args, **kwargs):
+        """
+        Serves offer list pages from the cache and fills the cache on a miss.
+        The ETag is a digest of the page itself, cached along with it, so it always matches the body
+        sent, even if another process still caches the page under an older generation.
+        """
+        cache_key = OfferListCache.make_key(request)
+        if (cached := OfferListCache.get(cache_key)) is None:
+            data = super().list(request, *args, **kwargs).data
+            cached = (make_etag(request, content_digest(data)), data)
+            OfferListCache.set(cache_key, cached)
+
+        etag, data = cached
+        if (response := check_conditions(request, etag)) is not None:
+            return response
+        return set_validators(Response(data), etag)
+
     def get_queryset(self):
         """
-        Returns a filtered and annotated queryset of offers.
+        Returns a filtered queryset of offers with their details prefetched.
         Supports query parameters: creator_id, search, max_delivery_time, min_price, ordering.
+        Search results are ordered by relevance unless an explicit ordering is given.
         """
         params = self.request.query_params
-        offers = Offer.objects.all()
-
-        offers = offers.annotate(
-            min_price=Min('details__price'),
-            min_delivery_time=Min('details__delivery_time_in_days')
-        )
+        offers = Offer.objects.prefetch_related('details')
 
         if (creator_id := params.get('creator_id')):
             offers = offers.filter(user_id=creator_id)
 
         if (search := params.get('search', '')):
-            offers = offers.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+            offers = SearchHelperOffers.apply_search(offers, search)
         
         if (max_delivery_time := params.get('max_delivery_time')):
             try:
-                offers = offers.filter(details__delivery_time_in_days__lte=int(max_delivery_time))
+                offers = offers.filter(min_delivery_time__lte=int(max_delivery_time))
             except ValueError:
                 raise ValidationError({"max_delivery_time": "Need to be a integer."})
             
@@ -67,6 +98,8 @@ class OfferListCreateView(ListCreateAPIView):
                 raise ValidationError({"min_price": "Need to be a number."})
             
         ordering = params.get('ordering')
+        if search and ordering not in OrderingHelperOffers.ORDERING_OPTIONS:
+            return SearchHelperOffers.order_by_rank(offers)
         offers = OrderingHelperOffers.apply_ordering(offers, ordering)
 
         return offers
@@ -78,9 +111,7 @@ class OfferListCreateView(ListCreateAPIView):
         """
         user = self.request.user
 
-        try:
-            profile = UserProfile.objects.get(user=self.request.user)
-        except UserProfile.DoesNotExist:
+        if (profile := get_request_profile(self.request)) is None:
             raise PermissionDenied("User-profile not found.")
 
         if profile.type != "business":
@@ -92,35 +123,36 @@ class OfferListCreateView(ListCreateAPIView):
 class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     API view to retrieve, update, or delete a single offer.
-    Annotates offers with min_price and min_delivery_time for GET responses.
+    Returns the stored min_price and min_delivery_time with GET responses,
+    with an ETag and Last-Modified derived from the offer's updated_at.
     Update and delete operations are restricted to the offer creator.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk, format=None):
         """
-        Retrieves a single offer by ID with annotated fields.
-        Returns 404 if the offer does not exist.
+        Retrieves a single offer by ID and loads its details only if the client's copy is outdated.
+        Returns 304 if it is unchanged and 404 if the offer does not exist.
         """
-        offer = get_object_or_404(
-            Offer.objects.annotate(
-                min_price=Min('details__price'),
-                min_delivery_time=Min('details__delivery_time_in_days')
-            ),
-            pk=pk
-        )
+        offer = get_object_or_404(Offer, pk=pk)
+        etag = make_etag(request, offer.updated_at)
+        if (response := check_conditions(request, etag, offer.updated_at)) is not None:
+            return response
+
+        prefetch_related_objects([offer], 'details')
         serializer = OfferSerializer(offer)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, offer.updated_at)
     
     def patch(self, request, pk, format=None):
         """
         Partially updates an offer if the requesting user is the creator.
+        Loads the details up front, so the update and the response reuse them.
         Returns 403 if the user is not the owner.
         """
 
-        offer = get_object_or_404(Offer, pk=pk)
+        offer = get_object_or_404(Offer.objects.prefetch_related('details'), pk=pk)
         
-        if offer.user != request.user:
+        if offer.user_id != request.user.id:
             raise PermissionDenied("Only the creator can edit the offer.")
         
         serializer = OfferSerializer(offer, data=request.data, partial=True, context={'request': request})
@@ -147,12 +179,48 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
 class OfferDetailOverviewView(generics.RetrieveAPIView):
     """
     API view to retrieve a single OfferDetail by ID.
-    Returns serialized data for the requested offer detail.
+    Returns serialized data for the requested offer detail, validated by the updated_at of its offer.
     Access restricted to authenticated users.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk, format=None):
-        offer = get_object_or_404(OfferDetails,pk=pk)
+        offer = get_object_or_404(OfferDetails.objects.annotate(offer_updated_at=F('offer__updated_at')), pk=pk)
+        etag = make_etag(request, offer.offer_updated_at)
+        if (response := check_conditions(request, etag, offer.offer_updated_at)) is not None:
+            return response
+
         serializer = OfferDetailSerializer(offer)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return set_validators(Response(serializer.data, status=status.HTTP_200_OK), etag, offer.offer_updated_at)
+
+
+class OfferBatchCreateView(APIView):
+    """
+    API view for creating many offers with their details in one request, e.g. for catalogue imports.
+    Accepts a list of offers in the format of the offer list endpoint, at most 100 per request.
+    Creation is restricted to authenticated business users only.
+    """
+    permission_classes = [IsAuthenticated]
+    max_batch_size = 100
+
+    def post(self, request, format=None):
+        """
+        Validates all offers and bulk-creates them in one transaction.
+        Returns 400 with per-offer errors if any offer is invalid, and 403 for non-business users.
+        """
+        if (profile := get_request_profile(request)) is None:
+            raise PermissionDenied("User-profile not found.")
+
+        if profile.type != "business":
+            raise PermissionDenied("Only business-user are allowed to create offers.")
+
+        serializer = OfferSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.max_batch_size,
+            context={'request': request}
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,69 @@
+import random
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from offers.models import Offer, OfferDetails
+
+
+class Command(BaseCommand):
+    """
+    Management command timing the combined max_delivery_time and min_price offer filters.
+    Seeds a generated catalogue inside a transaction that is rolled back afterwards,
+    and compares the stored-minimum filter with the former details join.
+    """
+    help = "Benchmarks the combined offer list filters on generated catalogues."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, nargs='+', default=[10000, 100000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        for size in options['offers']:
+            with transaction.atomic():
+                self._seed(size)
+                for label, queryset in self._querysets().items():
+                    milliseconds = self._measure(queryset, options['repeat'])
+                    self.stdout.write(f"{size} offers | {label}: {milliseconds:.1f} ms")
+                transaction.set_rollback(True)
+
+    def _seed(self, size):
+        """
+        Creates `size` offers with three details each and their stored minimums.
+        """
+        rng = random.Random(size)
+        user = User.objects.create_user(username=f"benchmark-{size}")
+        offers, details = [], []
+        for index in range(size):
+            packages = [(offer_type, rng.randint(10, 1000), rng.randint(1, 30)) for offer_type in ('basic', 'standard', 'premium')]
+            offer = Offer(user=user, title=f"Offer {index}", min_price=min(p[1] for p in packages), min_delivery_time=min(p[2] for p in packages))
+            offers.append(offer)
+            details.append(packages)
+        Offer.objects.bulk_create(offers, batch_size=2000)
+        OfferDetails.objects.bulk_create(
+            [
+                OfferDetails(offer=offer, title=offer_type, revisions=1, price=price, delivery_time_in_days=days, features=[], offer_type=offer_type)
+                for offer, packages in zip(offers, details)
+                for offer_type, price, days in packages
+            ],
+            batch_size=2000
+        )
+
+    def _querysets(self):
+        base = Offer.objects.filter(min_price__gte=500).order_by('-created_at', '-id')
+        return {
+            "stored minimum": base.filter(min_delivery_time__lte=3),
+            "details join": base.filter(details__delivery_time_in_days__lte=3).distinct(),
+        }
+
+    def _measure(self, queryset, repeat):
+        """
+        Returns the best time in milliseconds for one list page plus its count.
+        """
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset[:6])
+            queryset.count()
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Min, OuterRef, Subquery
+from django.db.models.functions import Now
+from offers.models import Offer, OfferDetails
+from offers.offers_cache.offers_cache import OfferListCache
+
+
+class Command(BaseCommand):
+    """
+    Management command rebuilding the stored min_price and min_delivery_time of all offers.
+    Runs a single UPDATE with correlated subqueries over the offer details. The UPDATE also sets updated_at,
+    which the offer ETags and Last-Modified headers are built from, and the cached list pages are invalidated.
+    """
+    help = "Rebuilds the stored min_price and min_delivery_time columns of all offers."
+
+    def handle(self, *args, **options):
+        details = OfferDetails.objects.filter(offer=OuterRef('pk')).values('offer')
+        updated = Offer.objects.update(
+            min_price=Subquery(details.annotate(value=Min('price')).values('value')),
+            min_delivery_time=Subquery(details.annotate(value=Min('delivery_time_in_days')).values('value')),
+            updated_at=Now()
+        )
+        OfferListCache.bump_generation()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt min values for {updated} offers."))
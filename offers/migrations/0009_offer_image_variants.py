@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0008_offer_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='image_thumbnail',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='offers_pics/'),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='image_thumbnail_webp',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='offers_pics/'),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='image_webp',
+            field=models.ImageField(blank=True, editable=False, max_length=255, upload_to='offers_pics/'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:43
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_processed_images(apps, schema_editor):
+    Offer = apps.get_model('offers', 'Offer')
+    Offer.objects.exclude(image_thumbnail_webp='').update(image_variants_source=F('image'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0009_offer_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='image_variants_source',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(mark_processed_images, migrations.RunPython.noop),
+    ]
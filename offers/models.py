@@ -6,20 +6,47 @@ class Offer(models.Model):
     """
     Model representing an offer created by a user, including title, image, and description.
     Tracks creation and last update timestamps.
+    Stores the lowest price and delivery time of its details for indexed filtering and ordering.
+    Keeps a thumbnail and WebP variants of the image, generated after upload by core.images.ImageVariants.
     Linked to the User model via a foreign key.
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="offer")
     title = models.CharField(max_length=255)
     image = models.ImageField(upload_to="offers_pics/", null=True, blank=True)
+    image_thumbnail = models.ImageField(upload_to="offers_pics/", max_length=255, blank=True, editable=False)
+    image_thumbnail_webp = models.ImageField(upload_to="offers_pics/", max_length=255, blank=True, editable=False)
+    image_webp = models.ImageField(upload_to="offers_pics/", max_length=255, blank=True, editable=False)
+    image_variants_source = models.CharField(max_length=255, blank=True, editable=False)
     description = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True, null=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.FloatField(null=True, blank=True)
+    min_delivery_time = models.IntegerField(null=True, blank=True, db_index=True)
 
     def __str__(self):
         return self.title
-    
+
+    def apply_min_values(self, details):
+        """
+        Sets min_price and min_delivery_time from the given details without querying or saving.
+        """
+        self.min_price = min((detail.price for detail in details), default=None)
+        self.min_delivery_time = min((detail.delivery_time_in_days for detail in details), default=None)
+
+    def cache_details(self, details):
+        """
+        Keeps the given details on the offer as loaded_details, which OfferSerializer
+        serializes instead of the 'details' relation, so that serializing the offer afterwards needs no query.
+        """
+        self.loaded_details = list(details)
+
     class Meta:
         verbose_name = "Offer Media"
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='offer_created_at_id_idx'),
+            models.Index(fields=['updated_at', 'id'], name='offer_updated_at_id_idx'),
+            models.Index(fields=['min_price', 'id'], name='offer_min_price_id_idx'),
+        ]
 
 
 class OfferDetails(models.Model):
@@ -0,0 +1,55 @@
+import time
+from hashlib import sha256
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import caches
+
+
+class OfferListCache:
+    """
+    Caches serialized offer list pages, together with their ETag, keyed on the normalized query parameters.
+    Every key embeds a generation counter that offer and offer detail writes bump,
+    so a single increment invalidates all cached pages at once.
+    The counter only reaches other processes through a shared cache, see OFFER_LIST_CACHE_TIMEOUT.
+    """
+    GENERATION_KEY = "offers:list:generation"
+
+    @staticmethod
+    def get_cache():
+        return caches[settings.OFFER_LIST_CACHE_ALIAS]
+
+    @staticmethod
+    def get_generation():
+        """
+        Returns the current generation, starting a new one from the clock if it was evicted
+        so that a restarted counter never reuses the keys of older entries.
+        """
+        cache = OfferListCache.get_cache()
+        cache.add(OfferListCache.GENERATION_KEY, time.time_ns(), timeout=None)
+        return cache.get(OfferListCache.GENERATION_KEY)
+
+    @staticmethod
+    def bump_generation():
+        cache = OfferListCache.get_cache()
+        try:
+            cache.incr(OfferListCache.GENERATION_KEY)
+        except ValueError:
+            cache.add(OfferListCache.GENERATION_KEY, time.time_ns(), timeout=None)
+
+    @staticmethod
+    def make_key(request) -> str:
+        """
+        Builds the cache key from the current generation, the absolute path and the sorted query parameters.
+        The absolute path is part of the key because pagination links embed scheme and host.
+        """
+        params = urlencode(sorted(request.query_params.lists()), doseq=True)
+        digest = sha256(f"{request.build_absolute_uri(request.path)}?{params}".encode()).hexdigest()
+        return f"offers:list:{OfferListCache.get_generation()}:{digest}"
+
+    @staticmethod
+    def get(key):
+        return OfferListCache.get_cache().get(key)
+
+    @staticmethod
+    def set(key, data):
+        OfferListCache.get_cache().set(key, data, timeout=settings.OFFER_LIST_CACHE_TIMEOUT)
@@ -4,11 +4,18 @@ class OrderingHelperOffers:
     ORDERING_OPTIONS = {
         "-updated_at": "-updated_at",
         "updated_at": "updated_at",
+        "-created_at": "-created_at",
+        "created_at": "created_at",
         "-min_price": "-min_price",
         "min_price": "min_price",
     }
 
     @staticmethod
-    def apply_ordering(queryset: QuerySet, ordering: str) -> QuerySet:
+    def get_ordering(ordering: str) -> tuple:
         ordering_field = OrderingHelperOffers.ORDERING_OPTIONS.get(ordering, "-created_at")
-        return queryset.order_by(ordering_field)
\ No newline at end of file
+        tiebreaker = "-id" if ordering_field.startswith("-") else "id"
+        return (ordering_field, tiebreaker)
+
+    @staticmethod
+    def apply_ordering(queryset: QuerySet, ordering: str) -> QuerySet:
+        return queryset.order_by(*OrderingHelperOffers.get_ordering(ordering))
@@ -0,0 +1,90 @@
+import re
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+
+class SearchHelperOffers:
+    """
+    Full-text search over offer titles and descriptions with ranked results.
+    Uses an FTS5 table on SQLite and a GIN-indexed tsvector on PostgreSQL,
+    falling back to icontains matching on other databases.
+    """
+    FTS_TABLE = "offers_offer_fts"
+    TSVECTOR = "to_tsvector('simple', coalesce(offers_offer.title, '') || ' ' || coalesce(offers_offer.description, ''))"
+
+    @staticmethod
+    def apply_search(queryset: QuerySet, search: str) -> QuerySet:
+        """
+        Filters the queryset to offers matching every search term as a prefix.
+        Adds a search_rank column where lower values mean better matches.
+        """
+        terms = re.findall(r"\w+", search)
+        vendor = connections[queryset.db].vendor
+        if terms and vendor == "sqlite":
+            return SearchHelperOffers._apply_fts5(queryset, terms)
+        if terms and vendor == "postgresql":
+            return SearchHelperOffers._apply_tsvector(queryset, terms)
+        return queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
+
+    @staticmethod
+    def order_by_rank(queryset: QuerySet) -> QuerySet:
+        """
+        Orders searched offers by relevance, newest first among equal ranks.
+        """
+        if "search_rank" not in queryset.query.extra_select:
+            return queryset.order_by("-created_at")
+        return queryset.order_by("search_rank", "-created_at")
+
+    @staticmethod
+    def _apply_fts5(queryset: QuerySet, terms: list) -> QuerySet:
+        table = SearchHelperOffers.FTS_TABLE
+        match = " ".join(f'"{term}"*' for term in terms)
+        return queryset.extra(
+            select={"search_rank": f"{table}.rank"},
+            tables=[table],
+            where=[f"{table}.rowid = offers_offer.id", f"{table} MATCH %s"],
+            params=[match],
+        )
+
+    @staticmethod
+    def _apply_tsvector(queryset: QuerySet, terms: list) -> QuerySet:
+        vector = SearchHelperOffers.TSVECTOR
+        query = " & ".join(f"{term}:*" for term in terms)
+        return queryset.extra(
+            select={"search_rank": f"-ts_rank({vector}, to_tsquery('simple', %s))"},
+            select_params=[query],
+            where=[f"{vector} @@ to_tsquery('simple', %s)"],
+            params=[query],
+        )
+
+    @staticmethod
+    def index_offer(offer, using="default"):
+        SearchHelperOffers.index_offers([offer], using=using)
+
+    @staticmethod
+    def index_offers(offers, using="default"):
+        """
+        Writes the offers' titles and descriptions into the FTS5 table in one batch.
+        PostgreSQL keeps its expression index up to date by itself.
+        """
+        connection = connections[using]
+        if connection.vendor != "sqlite":
+            return
+        table = SearchHelperOffers.FTS_TABLE
+        with connection.cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {table} WHERE rowid = %s", [[offer.pk] for offer in offers])
+            cursor.executemany(
+                f"INSERT INTO {table}(rowid, title, description) VALUES (%s, %s, %s)",
+                [[offer.pk, offer.title, offer.description] for offer in offers]
+            )
+
+    @staticmethod
+    def remove_offer(offer_id, using="default"):
+        """
+        Removes a deleted offer from the FTS5 table.
+        """
+        connection = connections[using]
+        if connection.vendor != "sqlite":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SearchHelperOffers.FTS_TABLE} WHERE rowid = %s", [offer_id])
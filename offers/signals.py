@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+from core.images import ImageVariants
+from offers.models import Offer, OfferDetails
+from offers.offers_cache.offers_cache import OfferListCache
+from offers.offers_search.offers_search import SearchHelperOffers
+
+SEARCH_FIELDS = {"title", "description"}
+
+offers_bulk_created = Signal()
+"""
+Sent with `offers` and `using` after offers and their details were inserted with bulk_create,
+which skips the per-instance save signals.
+"""
+
+
+@receiver(post_save, sender=Offer)
+def index_offer(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Keeps the search index in sync whenever an offer's title or description may have changed.
+    """
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    SearchHelperOffers.index_offer(instance, using=using)
+
+
+@receiver(post_save, sender=Offer)
+def generate_image_variants(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Queues thumbnails and WebP variants of a new or replaced offer image, or their removal with the image.
+    """
+    if update_fields is not None and "image" not in update_fields:
+        return
+    if ImageVariants.needs_update(instance, "image"):
+        ImageVariants.schedule(instance, "image", settings.OFFER_THUMBNAIL_SIZE, using=using)
+
+
+@receiver(post_delete, sender=Offer)
+def remove_offer_from_index(sender, instance, using, **kwargs):
+    """
+    Removes a deleted offer from the search index.
+    """
+    SearchHelperOffers.remove_offer(instance.pk, using=using)
+
+
+@receiver(post_delete, sender=Offer)
+def delete_image_variants(sender, instance, using, **kwargs):
+    """
+    Deletes the generated variants of a deleted offer's image.
+    """
+    ImageVariants.delete_variants(instance, "image", using=using)
+
+
+@receiver([post_save, post_delete], sender=Offer)
+@receiver([post_save, post_delete], sender=OfferDetails)
+def invalidate_offer_list_cache(sender, using, **kwargs):
+    """
+    Invalidates cached offer list pages right away and again once the transaction commits,
+    so that pages cached while the write was still uncommitted are dropped as well.
+    """
+    OfferListCache.bump_generation()
+    transaction.on_commit(OfferListCache.bump_generation, using=using)
+
+
+@receiver(offers_bulk_created)
+def index_bulk_created_offers(sender, offers, using, **kwargs):
+    """
+    Adds bulk-created offers to the search index in one batch.
+    """
+    SearchHelperOffers.index_offers(offers, using=using)
+
+
+@receiver(offers_bulk_created)
+def invalidate_offer_list_cache_after_bulk_create(sender, offers, using, **kwargs):
+    """
+    Invalidates cached offer list pages once for a whole batch of offers.
+    """
+    invalidate_offer_list_cache(sender, using=using)
@@ -0,0 +1,74 @@
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from auth_app.models import UserProfile, PlatformStats
+from offers.models import Offer, OfferDetails
+
+# Writing the SQLite FTS5 search index takes a batched DELETE and INSERT; PostgreSQL needs none.
+SEARCH_INDEX_QUERIES = 2 if connection.vendor == "sqlite" else 0
+
+
+def offer_payload(title, prices=(100, 200, 300)):
+    return {
+        'title': title,
+        'description': f'{title} description.',
+        'details': [
+            {'title': offer_type, 'offer_type': offer_type, 'price': price, 'delivery_time_in_days': days, 'revisions': 1, 'features': ['Feature']}
+            for offer_type, price, days in zip(['basic', 'standard', 'premium'], prices, [3, 5, 7])
+        ]
+    }
+
+
+class OfferBatchCreateTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_post_offer_batch(self):
+        payload = [offer_payload(f"Imported {index}", prices=(50 + index, 200, 300)) for index in range(3)]
+
+        with self.assertNumQueries(5 + SEARCH_INDEX_QUERIES):
+            response = self.client.post(reverse('offer-batch'), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([offer["min_price"] for offer in response.data], [50, 51, 52])
+        self.assertEqual(len(response.data[0]["details"]), 3)
+        self.assertEqual(OfferDetails.objects.filter(offer__user=self.user).count(), 9)
+        self.assertEqual(PlatformStats.load().offer_count, 3)
+
+        search = self.client.get(reverse('offer-list'), {'search': 'imported'})
+        self.assertEqual(search.data["count"], 3)
+
+    def test_post_offer_batch_rolls_back_on_invalid_offer(self):
+        invalid_offer = offer_payload("Broken")
+        invalid_offer['details'] = invalid_offer['details'][:2]
+
+        response = self.client.post(reverse('offer-batch'), [offer_payload("Valid"), invalid_offer], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Offer.objects.exists())
+
+    def test_post_offer_batch_customer_403(self):
+        self.profile.type = "customer"
+        self.profile.save()
+
+        response = self.client.post(reverse('offer-batch'), [offer_payload("Imported")], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_post_offer_with_invalid_detail_creates_nothing(self):
+        payload = offer_payload("Broken", prices=("cheap", 200, 300))
+
+        response = self.client.post(reverse('offer-list'), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Offer.objects.exists())
@@ -1,3 +1,6 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
 from django.urls import reverse
 from django.contrib.auth.models import User
 from rest_framework import status
@@ -6,6 +9,9 @@ from rest_framework.authtoken.models import Token
 from auth_app.models import UserProfile
 from offers.models import OfferDetails, Offer
 
+# Writing the SQLite FTS5 search index takes a batched DELETE and INSERT; PostgreSQL needs none.
+SEARCH_INDEX_QUERIES = 2 if connection.vendor == "sqlite" else 0
+
 
 class OfferDetailsGetTest(APITestCase):
     
@@ -119,6 +125,7 @@ class OfferDetailsPatchTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Updated Test-Paket")
+        self.assertEqual(response.data["min_price"], 150)
 
         for detail in response.data["details"]:
             self.assertIn("id", detail)
@@ -174,6 +181,42 @@ class OfferDetailsPatchTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_patch_offer_detail_prices_queries(self):
+        for offer_type, price in [("standard", 120), ("premium", 200)]:
+            OfferDetails.objects.create(
+                offer=self.offer, title=offer_type, revisions=2, delivery_time_in_days=7,
+                price=price, features=["Logo Design"], offer_type=offer_type
+            )
+        url = reverse('offer-details', kwargs={'pk': self.offer.id})
+        payload = {"details": [
+            {"offer_type": "basic", "price": 80},
+            {"offer_type": "standard", "price": 130},
+            {"offer_type": "premium", "price": 200},
+        ]}
+
+        with self.assertNumQueries(7 + SEARCH_INDEX_QUERIES):
+            response = self.client.patch(url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["min_price"], 80)
+        self.assertEqual([detail["price"] for detail in response.data["details"]], [80, 130, 200])
+        self.assertEqual(
+            list(self.offer.details.order_by('id').values_list('price', 'title')),
+            [(80, "Test Offer"), (130, "standard"), (200, "premium")]
+        )
+
+    def test_patch_offer_detail_invalid_price_changes_nothing(self):
+        url = reverse('offer-details', kwargs={'pk': self.offer.id})
+        payload = {"title": "Updated Test-Paket", "details": [{"offer_type": "basic", "price": "cheap"}]}
+
+        response = self.client.patch(url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.offer.refresh_from_db()
+        self.details.refresh_from_db()
+        self.assertEqual(self.offer.title, "Test Offer")
+        self.assertEqual(self.details.price, 75)
+
 class OfferDetailsDeleteTest(APITestCase):
     
     def setUp(self):
@@ -219,4 +262,61 @@ class OfferDetailsDeleteTest(APITestCase):
         url = reverse('offer-details', kwargs={'pk':self.details.id})
         response = self.client.delete(url)
 
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class OfferConditionalGetTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.offer = Offer.objects.create(user=self.user, title="Test Offer", description="Test Offer Description")
+        self.detail = OfferDetails.objects.create(
+            offer=self.offer, title="Basic", revisions=2, delivery_time_in_days=7,
+            price=75, features=["Logo Design"], offer_type="basic"
+        )
+
+    def test_unchanged_offer_is_answered_with_304(self):
+        url = reverse('offer-details', kwargs={'pk': self.offer.id})
+        response = self.client.get(url)
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(since.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_changed_offer_is_sent_again(self):
+        url = reverse('offer-details', kwargs={'pk': self.offer.id})
+        etag = self.client.get(url)["ETag"]
+
+        self.client.patch(url, {"details": [{"offer_type": "basic", "price": 80}]}, format="json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["min_price"], 80)
+
+    def test_rebuilt_min_values_change_the_etag(self):
+        Offer.objects.filter(pk=self.offer.pk).update(min_price=None, min_delivery_time=None)
+        url = reverse('offer-details', kwargs={'pk': self.offer.id})
+        etag = self.client.get(url)["ETag"]
+
+        call_command('rebuild_offer_min_values', stdout=StringIO())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["min_price"], 75)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unchanged_offer_detail_is_answered_with_304(self):
+        url = reverse('detail-overview', kwargs={'pk': self.detail.id})
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
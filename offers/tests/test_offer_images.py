@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from PIL import Image
+from rest_framework.test import APITestCase, APIClient
+from auth_app.models import UserProfile
+from core.images import ImageVariants
+from offers.models import Offer, OfferDetails
+
+
+def make_image(name="logo.png", size=(1200, 800), mode="RGB"):
+    buffer = BytesIO()
+    Image.new(mode, size, "orange").save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class OfferImageVariantsTest(APITestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, TASK_QUEUE_BACKEND="immediate")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.offer = Offer.objects.create(user=self.user, title="Test Offer", description="Test Offer Description")
+        OfferDetails.objects.create(
+            offer=self.offer, title="Basic", revisions=2, delivery_time_in_days=7,
+            price=75, features=["Logo Design"], offer_type="basic"
+        )
+
+    def upload(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer.image = image
+            self.offer.save()
+        self.offer.refresh_from_db()
+
+    def test_upload_generates_thumbnails_and_webp_variants(self):
+        self.upload(make_image())
+
+        with Image.open(self.offer.image_thumbnail.path) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ("JPEG", (400, 300)))
+        with Image.open(self.offer.image_thumbnail_webp.path) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ("WEBP", (400, 300)))
+        with Image.open(self.offer.image_webp.path) as webp:
+            self.assertEqual((webp.format, webp.size), ("WEBP", (1200, 800)))
+        self.assertEqual(self.offer.image_thumbnail.name, "offers_pics/logo-thumb.jpg")
+
+    def test_transparent_image_gets_png_thumbnail(self):
+        self.upload(make_image(mode="RGBA"))
+
+        self.assertTrue(self.offer.image_thumbnail.name.endswith(".png"))
+
+    def test_variant_urls_are_listed(self):
+        self.upload(make_image())
+
+        detail = self.client.get(reverse('offer-details', kwargs={'pk': self.offer.id})).data
+        listed = self.client.get(reverse('offer-list')).data["results"][0]
+
+        self.assertTrue(detail["image_thumbnail_webp"].endswith("offers_pics/logo-thumb.webp"))
+        self.assertTrue(detail["image_webp"].endswith("offers_pics/logo-full.webp"))
+        for field in ("image", "image_thumbnail", "image_thumbnail_webp", "image_webp"):
+            self.assertTrue(listed[field].endswith(detail[field]))
+
+    def test_replaced_image_replaces_variants(self):
+        self.upload(make_image())
+        old_thumbnail = self.offer.image_thumbnail.path
+
+        self.upload(make_image("banner.png", size=(300, 300)))
+
+        self.assertEqual(self.offer.image_thumbnail_webp.name, "offers_pics/banner-thumb.webp")
+        with Image.open(self.offer.image_webp.path) as webp:
+            self.assertEqual(webp.size, (300, 300))
+        self.assertFalse(os.path.exists(old_thumbnail))
+
+    def test_removed_image_removes_variants(self):
+        self.upload(make_image())
+
+        self.upload(None)
+
+        self.assertEqual(
+            (self.offer.image_thumbnail.name, self.offer.image_thumbnail_webp.name, self.offer.image_webp.name),
+            ("", "", "")
+        )
+
+    def test_unreadable_image_gets_no_variants(self):
+        self.upload(SimpleUploadedFile("broken.png", b"not an image", content_type="image/png"))
+
+        self.assertEqual(self.offer.image_thumbnail.name, "")
+
+    def test_unreadable_image_is_processed_once(self):
+        self.upload(SimpleUploadedFile("broken.png", b"not an image", content_type="image/png"))
+
+        with patch.object(ImageVariants, "schedule") as schedule:
+            self.offer.title = "Updated Offer"
+            self.offer.save()
+
+        schedule.assert_not_called()
+
+    def test_deleted_offer_deletes_variants(self):
+        self.upload(make_image())
+        paths = [self.offer.image_thumbnail.path, self.offer.image_thumbnail_webp.path, self.offer.image_webp.path]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.offer.delete()
+
+        self.assertFalse(any(os.path.exists(path) for path in paths))
+
+    def test_update_without_new_image_is_not_processed_again(self):
+        self.upload(make_image())
+
+        with patch.object(ImageVariants, "schedule") as schedule:
+            self.offer.title = "Updated Offer"
+            self.offer.save()
+
+        schedule.assert_not_called()
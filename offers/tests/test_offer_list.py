@@ -1,3 +1,7 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
 from rest_framework import status
@@ -52,3 +56,158 @@ class OfferListTest(APITestCase):
         response = self.client.post(url, payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["min_price"], 250)
+        self.assertEqual(response.data["min_delivery_time"], 4)
+
+    def test_combined_filters_return_each_offer_once(self):
+        call_command('rebuild_offer_min_values', stdout=StringIO())
+        url = reverse('offer-list')
+        response = self.client.get(url, {'max_delivery_time': 10, 'min_price': 50})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["min_price"], 100)
+        self.assertEqual(response.data["results"][0]["min_delivery_time"], 5)
+
+    def test_max_delivery_time_uses_fastest_package(self):
+        call_command('rebuild_offer_min_values', stdout=StringIO())
+        url = reverse('offer-list')
+
+        self.assertEqual(self.client.get(url, {'max_delivery_time': 5}).data["count"], 1)
+        self.assertEqual(self.client.get(url, {'max_delivery_time': 4}).data["count"], 0)
+
+    def test_rebuild_offer_min_values_command(self):
+        offer = Offer.objects.get(title="Tech Design")
+        self.assertIsNone(offer.min_price)
+
+        call_command('rebuild_offer_min_values', stdout=StringIO())
+
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, 100)
+        self.assertEqual(offer.min_delivery_time, 5)
+
+
+class OfferListQueryCountTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+
+        for index in range(10):
+            offer = Offer.objects.create(user=self.user, title=f"Offer {index}", description="Offer description.")
+            OfferDetails.objects.create(offer=offer, offer_type="basic", price=100, delivery_time_in_days=5, revisions=1, features=["Basic"])
+            OfferDetails.objects.create(offer=offer, offer_type="standard", price=150, delivery_time_in_days=7, revisions=1, features=["Standard"])
+            OfferDetails.objects.create(offer=offer, offer_type="premium", price=250, delivery_time_in_days=10, revisions=1, features=["Premium"])
+
+    def count_list_queries(self, page_size):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('offer-list'), {'page_size': page_size})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), page_size)
+        return len(queries)
+
+    def test_offer_list_query_count_is_constant(self):
+        self.assertEqual(self.count_list_queries(1), self.count_list_queries(10))
+
+    def test_offer_detail_fetches_details_in_one_query(self):
+        offer = Offer.objects.first()
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('offer-details', kwargs={'pk': offer.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["details"]), 3)
+
+
+class OfferListCursorPaginationTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+
+        for index in range(7):
+            Offer.objects.create(user=self.user, title=f"Offer {index}", description="Offer description.", min_price=100 + index % 3)
+
+    def collect_pages(self, **params):
+        url = reverse('offer-list')
+        query = {'pagination': 'cursor', 'page_size': 3, **params}
+        offer_ids = []
+        while url:
+            response = self.client.get(url, query)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            offer_ids += [offer["id"] for offer in response.data["results"]]
+            url, query = response.data["next"], None
+        return offer_ids
+
+    def test_cursor_pagination_visits_every_offer_once(self):
+        offer_ids = self.collect_pages()
+
+        self.assertEqual(offer_ids, list(Offer.objects.order_by('-created_at', '-id').values_list('id', flat=True)))
+
+    def test_cursor_pagination_breaks_price_ties_by_id(self):
+        offer_ids = self.collect_pages(ordering='min_price')
+
+        self.assertEqual(offer_ids, list(Offer.objects.order_by('min_price', 'id').values_list('id', flat=True)))
+
+    def test_cursor_pagination_pages_back(self):
+        first = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'page_size': 3, 'ordering': 'min_price'}).data
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+
+        self.assertEqual(back["results"], first["results"])
+        self.assertIsNone(back["previous"])
+        self.assertEqual(self.client.get(back["next"]).data["results"], second["results"])
+
+    def test_cursor_pagination_puts_offers_without_price_last(self):
+        unpriced = [Offer.objects.create(user=self.user, title=f"Draft {index}").id for index in range(2)]
+
+        ascending = self.collect_pages(ordering='min_price')
+        descending = self.collect_pages(ordering='-min_price')
+
+        self.assertEqual(ascending[-2:], unpriced)
+        self.assertEqual(descending[-2:], unpriced[::-1])
+        self.assertEqual(len(set(ascending)), 9)
+
+    def test_cursor_pagination_seeks_into_price_ties(self):
+        Offer.objects.bulk_create(Offer(user=self.user, title="Tied", min_price=100) for _ in range(20))
+        response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'page_size': 4, 'ordering': 'min_price'})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.client.get(response.data["next"]).data["next"])
+
+        page_queries = [query["sql"] for query in queries if "offers_offer" in query["sql"] and "offers_offerdetails" not in query["sql"]]
+        self.assertIn('"offers_offer"."min_price" = ', page_queries[0])
+        self.assertFalse(any("OFFSET" in sql for sql in page_queries))
+        self.assertEqual(
+            [offer["id"] for offer in response.data["results"]],
+            list(Offer.objects.order_by('min_price', 'id').values_list('id', flat=True)[8:12])
+        )
+
+    def test_cursor_pagination_of_search_needs_explicit_ordering(self):
+        response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'search': 'offer'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.data)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'cursor': 'garbage'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_pagination_skips_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('offer-list'), {'pagination': 'cursor'})
+
+        self.assertFalse(any("COUNT(" in query["sql"] for query in queries))
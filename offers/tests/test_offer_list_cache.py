@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from auth_app.models import UserProfile
+from offers.models import Offer, OfferDetails
+
+
+class OfferListCacheTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+
+        self.offer = Offer.objects.create(user=self.user, title="Tech Design", description="Nice tech design.")
+        self.detail = OfferDetails.objects.create(offer=self.offer, offer_type="basic", price=100, delivery_time_in_days=5, revisions=1, features=["Add Feature here"])
+
+    def test_repeated_list_request_is_served_from_cache(self):
+        url = reverse('offer-list')
+        first_response = self.client.get(url, {'page_size': 3, 'search': 'tech'})
+
+        with self.assertNumQueries(0):
+            second_response = self.client.get(url, {'search': 'tech', 'page_size': 3})
+
+        self.assertEqual(second_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_response.data, first_response.data)
+
+    def test_offer_write_invalidates_cached_pages(self):
+        url = reverse('offer-list')
+        self.client.get(url)
+
+        self.offer.title = "Updated Tech Design"
+        self.offer.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["results"][0]["title"], "Updated Tech Design")
+
+    def test_detail_write_invalidates_cached_pages(self):
+        url = reverse('offer-list')
+        self.client.get(url)
+
+        self.detail.delete()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["results"][0]["details"], [])
+
+    def test_invalid_parameters_are_not_cached(self):
+        url = reverse('offer-list')
+        response = self.client.get(url, {'min_price': 'cheap'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {'min_price': 'cheap'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unchanged_list_is_answered_with_304(self):
+        url = reverse('offer-list')
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        self.offer.title = "Updated Tech Design"
+        self.offer.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_follows_the_page_content(self):
+        url = reverse('offer-list')
+        etag = self.client.get(url)["ETag"]
+
+        # A process that missed the invalidation rebuilds the page once its cache entry expired.
+        Offer.objects.filter(pk=self.offer.pk).update(title="Renamed elsewhere")
+        cache.clear()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["title"], "Renamed elsewhere")
+        self.assertNotEqual(response["ETag"], etag)
@@ -0,0 +1,56 @@
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from auth_app.models import UserProfile
+from offers.models import Offer
+
+
+class OfferSearchTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.client = APIClient()
+
+        self.logo_offer = Offer.objects.create(user=self.user, title="Logo Design", description="Logo and branding for your logo.")
+        self.web_offer = Offer.objects.create(user=self.user, title="Web Development", description="Websites with a fresh logo.")
+        self.text_offer = Offer.objects.create(user=self.user, title="Copywriting", description="Texts for your website.")
+
+    def search_titles(self, search, **params):
+        response = self.client.get(reverse('offer-list'), {'search': search, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [offer["title"] for offer in response.data["results"]]
+
+    def test_search_matches_title_and_description_prefixes(self):
+        self.assertEqual(set(self.search_titles("webs")), {"Web Development", "Copywriting"})
+
+    def test_search_orders_by_relevance(self):
+        self.assertEqual(self.search_titles("logo"), ["Logo Design", "Web Development"])
+
+    def test_search_respects_explicit_ordering(self):
+        self.assertEqual(self.search_titles("logo", ordering="updated_at"), ["Logo Design", "Web Development"])
+        self.assertEqual(self.search_titles("logo", ordering="-updated_at"), ["Web Development", "Logo Design"])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        self.text_offer.title = "Logo Copywriting"
+        self.text_offer.save()
+        self.web_offer.delete()
+
+        self.assertEqual(set(self.search_titles("logo")), {"Logo Design", "Logo Copywriting"})
+
+    def test_search_without_word_characters_falls_back_to_contains(self):
+        self.assertEqual(self.search_titles("&"), [])
+
+    def test_search_uses_fts_index_on_sqlite(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("FTS5 is only used on SQLite.")
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT rowid FROM offers_offer_fts WHERE offers_offer_fts MATCH 'logo'")
+            indexed_ids = {row[0] for row in cursor.fetchall()}
+        self.assertEqual(indexed_ids, {self.logo_offer.id, self.web_offer.id})
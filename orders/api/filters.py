@@ -0,0 +1,15 @@
+import django_filters
+from orders.models import Order
+
+
+class OrderFilter(django_filters.FilterSet):
+    """
+    Filters the order list by status, package type and a creation date range.
+    created_after and created_before accept ISO dates or datetimes and are inclusive.
+    """
+    created_after = django_filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = django_filters.DateTimeFilter(field_name='created_at', lookup_expr='lte')
+
+    class Meta:
+        model = Order
+        fields = ['status', 'offer_type']
@@ -0,0 +1,95 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.utils.urls import replace_query_param
+from orders.models import Order
+
+class OrderCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the order list, newest orders first with the id as tiebreaker.
+    The cursor holds the created_at and the id of the row it points at.
+    Each of the view's union filters (one per side the user is on) becomes its own UNION ALL branch,
+    cut at the cursor and limited to the page size, so every branch is a range search on its
+    (owner, created_at, id) index and only the few rows of one page per branch are sorted.
+    Skips the COUNT query and keeps deep pages as cheap as the first one.
+    Supports custom page size up to a maximum of 100 via query parameter.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_position(request)
+        union_filters = view.get_union_filters() if hasattr(view, 'get_union_filters') else [Q()]
+
+        rows = list(self.get_page_queryset(queryset, union_filters, position, reverse))
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next, has_previous = (position is not None, has_more) if reverse else (has_more, position is not None)
+        self.next_link = self.encode_position(rows[-1], False) if rows and has_next else None
+        self.previous_link = self.encode_position(rows[0], True) if rows and has_previous else None
+        return rows
+
+    def get_page_queryset(self, queryset, union_filters, position, reverse):
+        """
+        Returns the rows of the page after the position plus one, to tell whether there is a further page.
+        SQLite does not allow LIMIT inside a compound select, so each branch selects its ids through a limited subquery.
+        """
+        step, direction = ("gt", "") if reverse else ("lt", "-")
+        ordering = (f"{direction}created_at", f"{direction}id")
+        limit = self.page_size + 1
+
+        cursor = Q()
+        if position is not None:
+            created_at, pk = position
+            cursor = Q(**{f"created_at__{step}e": created_at}) & (Q(**{f"created_at__{step}": created_at}) | Q(**{f"id__{step}": pk}))
+
+        branches = [
+            Order.objects.filter(pk__in=queryset.filter(union_filter, cursor).order_by(*ordering).values('id')[:limit]).values('id')
+            for union_filter in union_filters
+        ]
+        ids = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+        # The branches already applied the filters; repeating them here would let SQLite read all orders of the user.
+        page = Order.objects.filter(pk__in=ids).order_by(*ordering)
+        if queryset.query.values_select:
+            page = page.values(*queryset.query.values_select)
+        return page[:limit]
+
+    def encode_position(self, row, reverse):
+        created_at = row["created_at"] if isinstance(row, dict) else row.created_at
+        pk = row["id"] if isinstance(row, dict) else row.pk
+        data = json.dumps({"v": created_at, "i": pk, "r": reverse}, cls=JSONEncoder)
+        return replace_query_param(self.base_url, self.cursor_query_param, urlsafe_b64encode(data.encode()).decode())
+
+    def decode_position(self, request):
+        """
+        Returns the (created_at, id) position of the cursor, None without a cursor, and whether to page backwards.
+        Raises NotFound for malformed cursors.
+        """
+        if (encoded := request.query_params.get(self.cursor_query_param)) is None:
+            return None, False
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode()))
+            created_at = Order._meta.get_field("created_at").to_python(data["v"])
+            if created_at is None:
+                raise ValueError("Cursor without created_at.")
+            return (created_at, int(data["i"])), bool(data["r"])
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        return self.next_link
+
+    def get_previous_link(self):
+        return self.previous_link
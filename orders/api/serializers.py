@@ -1,6 +1,7 @@
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from core.serialization import ValuesSerializer, datetime_converter
 from orders.models import Order
 from offers.models import OfferDetails
 
@@ -29,6 +30,20 @@ class OrderSerializer(serializers.ModelSerializer):
         ]
 
 
+class OrderValuesSerializer(ValuesSerializer):
+    """
+    Read-only list serializer producing the same output as OrderSerializer from .values() rows.
+    """
+    fields = OrderSerializer.Meta.fields
+
+    def get_converters(self):
+        return {
+            'price': float,
+            'created_at': datetime_converter(),
+            'updated_at': datetime_converter(),
+        }
+
+
 class OrderCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating Orders from an OfferDetail ID, validates revisions,
@@ -110,4 +125,16 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
         if invalid_fields:
             raise ValidationError(f"Only 'status' can be updated. Invalid fields: {', '.join(invalid_fields)}")
 
-        return super().update(instance, validated_data)
\ No newline at end of file
+        return super().update(instance, validated_data)
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """
+    Serializer for the bulk status endpoint: a list of order ids and the status to move them to.
+    Accepts at most 500 ids per request.
+    """
+    order_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500
+    )
+    status = serializers.ChoiceField(choices=Order.STATUS)
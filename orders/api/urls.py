@@ -1,10 +1,13 @@
 from django.urls import path
-from .views import OrderListCreateView, OrderUpdateDeleteView, OrderCountView, CompletedOrderCountView
+from .views import OrderListCreateView, OrderUpdateDeleteView, OrderCountView, CompletedOrderCountView, OrderStatusCountView, OrderExportView, OrderBulkStatusView
 
 
 urlpatterns = [
     path('orders/', OrderListCreateView.as_view(), name='order-list'),
+    path('orders/export/', OrderExportView.as_view(), name='order-export'),
+    path('orders/bulk-status/', OrderBulkStatusView.as_view(), name='order-bulk-status'),
     path('orders/<int:pk>/', OrderUpdateDeleteView.as_view(), name='order-update'),
     path('order-count/<int:business_user_id>/', OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/', CompletedOrderCountView.as_view(), name='order-completed-count'),
+    path('order-status-count/<int:business_user_id>/', OrderStatusCountView.as_view(), name='order-status-count'),
 ]
\ No newline at end of file
@@ -1,25 +1,35 @@
 from django.db.models import Q
-from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied, MethodNotAllowed
+from rest_framework.exceptions import PermissionDenied, MethodNotAllowed, ValidationError
 from orders.models import Order
-from .serializers import OrderSerializer, OrderCreateSerializer, OrderUpdateSerializer
-from auth_app.models import UserProfile
+from orders.orders_counting.orders_counting import OrderCountHelper
+from orders.orders_export.orders_export import OrderExportHelper
+from orders.orders_status.orders_status import OrderStatusHelper
+from .serializers import OrderSerializer, OrderCreateSerializer, OrderUpdateSerializer, OrderBulkStatusSerializer, OrderValuesSerializer
+from .filters import OrderFilter
+from .pagination import OrderCursorPagination
+from auth_app.api.authentication import get_request_profile
+from core.serialization import ValuesListMixin
 
 
-class OrderListCreateView(ListCreateAPIView):
+class OrderListCreateView(ValuesListMixin, ListCreateAPIView):
     """
     API view for listing Orders for the current user and creating new Orders.
     Uses OrderCreateSerializer for POST requests and OrderSerializer for GET requests.
+    Lists are cursor-paginated, filterable by status, offer_type, created_after and created_before,
+    and built from .values() rows by OrderValuesSerializer.
     Only users with a customer profile can create new orders.
     """
     permission_classes = [IsAuthenticated]
-    pagination_class = None
+    pagination_class = OrderCursorPagination
+    values_serializer_class = OrderValuesSerializer
+    filterset_class = OrderFilter
     
     def get_serializer_class(self):
         """
@@ -34,10 +44,15 @@ class OrderListCreateView(ListCreateAPIView):
     def get_queryset(self):
         """
         Returns all Orders where the current user is either the customer or the business user.
-        Ensures users only see orders relevant to them.
         """
-        user = self.request.user
-        return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+        return Order.objects.filter(Q(customer_user=self.request.user) | Q(business_user=self.request.user))
+
+    def get_union_filters(self):
+        """
+        Returns one filter per side the user can be on. OrderCursorPagination reads each side as its own
+        UNION branch, so each one is a range search on its (owner, created_at, id) index.
+        """
+        return [Q(customer_user=self.request.user), Q(business_user=self.request.user)]
 
     def perform_create(self, serializer):
         """
@@ -45,15 +60,76 @@ class OrderListCreateView(ListCreateAPIView):
         Raises PermissionDenied if the profile is missing or the user is not a customer.
         Saves the serializer if validation passes.
         """
-        try:
-            profile = UserProfile.objects.get(user=self.request.user)
-        except UserProfile.DoesNotExist:
+        if (profile := get_request_profile(self.request)) is None:
             raise PermissionDenied("User profile not found.")
         if profile.type != "customer":
             raise PermissionDenied("Only customers can create orders.")
         serializer.save()
 
 
+class OrderExportView(APIView):
+    """
+    Streams all orders of the current business user as CSV or NDJSON, e.g. for accounting.
+    Accepts the filters of the order list and export_format=csv|ndjson (default csv).
+    Only users with a business profile can export orders.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, format=None):
+        """
+        Returns a streaming download of the filtered orders, oldest first.
+        Returns 400 for an unknown export_format or invalid filters, and 403 for non-business users.
+        """
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in OrderExportHelper.FORMATS:
+            raise ValidationError({"export_format": f"Must be one of: {', '.join(OrderExportHelper.FORMATS)}."})
+
+        if (profile := get_request_profile(request)) is None:
+            raise PermissionDenied("User profile not found.")
+        if profile.type != "business":
+            raise PermissionDenied("Only business users can export orders.")
+
+        order_filter = OrderFilter(request.query_params, queryset=Order.objects.filter(business_user=request.user))
+        if not order_filter.is_valid():
+            raise ValidationError(order_filter.errors)
+
+        response = StreamingHttpResponse(
+            OrderExportHelper.stream(order_filter.qs, export_format),
+            content_type=OrderExportHelper.FORMATS[export_format]
+        )
+        response["Content-Disposition"] = f'attachment; filename="orders.{export_format}"'
+        return response
+
+
+class OrderBulkStatusView(APIView):
+    """
+    Changes the status of many orders of the current business user in one request.
+    Only in_progress orders can be completed or cancelled; other orders are reported, not changed.
+    Only users with a business profile can update order statuses.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def patch(self, request, format=None):
+        """
+        Applies the status to all given orders the user owns with a single UPDATE.
+        Returns one result per given id (updated, unchanged, invalid_transition, not_found or duplicate).
+        Returns 403 if the user profile is missing or not business type.
+        """
+        if (profile := get_request_profile(request)) is None:
+            raise PermissionDenied("User profile not found.")
+        if profile.type != "business":
+            raise PermissionDenied("Only business users can update the order status.")
+
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = OrderStatusHelper.bulk_transition(
+            request.user,
+            serializer.validated_data["order_ids"],
+            serializer.validated_data["status"]
+        )
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
 class OrderUpdateDeleteView(RetrieveUpdateDestroyAPIView):
     """
     Handles retrieving, updating, and deleting Orders: restricts DELETE to admins, updates to business users, forbids GET/PUT.
@@ -80,9 +156,7 @@ class OrderUpdateDeleteView(RetrieveUpdateDestroyAPIView):
         """
         order = get_object_or_404(Order, pk=kwargs.get("pk"))
 
-        try:
-            profile = UserProfile.objects.get(user=request.user)
-        except UserProfile.DoesNotExist:
+        if (profile := get_request_profile(request)) is None:
             raise PermissionDenied("User profile not found.")
 
         if profile.type != "business":
@@ -137,14 +211,12 @@ class OrderCountView(APIView):
         Retrieves the number of orders with status 'in_progress' for the given business user ID.
         Returns 404 if the business user does not exist.
         """
-        try:
-            business_user = User.objects.get(id=business_user_id)
-        except User.DoesNotExist:
+        counts = OrderCountHelper.get_status_counts(business_user_id, business_only=False)
+        if counts is None:
             return Response({"detail": "No business user found with this ID."}, status=404)
-        
-        order_count = Order.objects.filter(business_user=business_user, status="in_progress").count()
-        return Response({"order_count": order_count}, status=200)  
-    
+
+        return Response({"order_count": counts["in_progress"]}, status=200)
+
 
 class CompletedOrderCountView(APIView):
     """
@@ -158,13 +230,27 @@ class CompletedOrderCountView(APIView):
         Retrieves the number of orders with status 'completed' for the given business user ID.
         Returns 404 if the business user does not exist.
         """
-        try:
-            business_user = User.objects.get(
-                id=business_user_id,
-                profile__type="business"
-            )
-        except User.DoesNotExist:
+        counts = OrderCountHelper.get_status_counts(business_user_id)
+        if counts is None:
             return Response({"detail": "No business user found with this ID."}, status=404)
-        
-        completed_order_count = Order.objects.filter(business_user=business_user, status="completed").count()
-        return Response({"completed_order_count": completed_order_count}, status=200)
\ No newline at end of file
+
+        return Response({"completed_order_count": counts["completed"]}, status=200)
+
+
+class OrderStatusCountView(APIView):
+    """
+    Returns the number of orders per status for a specific business user.
+    Accessible only to authenticated users.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        """
+        Retrieves the in_progress, completed and cancelled order counts of the given business user.
+        Returns 404 if the business user does not exist.
+        """
+        counts = OrderCountHelper.get_status_counts(business_user_id)
+        if counts is None:
+            return Response({"detail": "No business user found with this ID."}, status=404)
+
+        return Response(counts, status=200)
@@ -30,4 +30,12 @@ class Order (models.Model):
     offer_type = models.CharField(max_length=8, choices=PAKET_TYPES)
     status = models.CharField(max_length=12, choices=STATUS, default='in_progress')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
\ No newline at end of file
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'status'], name='order_business_status_idx'),
+            models.Index(fields=['customer_user', 'business_user', 'status'], name='order_customer_business_idx'),
+            models.Index(fields=['customer_user', 'created_at', 'id'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at', 'id'], name='order_business_created_idx'),
+        ]
@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from django.db.models import Count, Q
+from orders.models import Order
+
+class OrderCountHelper:
+    """
+    Counts a business user's orders per status in a single grouped query.
+    The user lookup is part of that query, so a missing user costs no extra round trip.
+    """
+    STATUSES = [status for status, label in Order.STATUS]
+
+    @staticmethod
+    def get_status_counts(business_user_id: int, business_only: bool = True):
+        """
+        Returns the number of orders per status for a business user from one grouped query,
+        or None if no matching user exists.
+        """
+        users = User.objects.filter(id=business_user_id)
+        if business_only:
+            users = users.filter(profile__type="business")
+        counts = {
+            status: Count('business_user', filter=Q(business_user__status=status))
+            for status in OrderCountHelper.STATUSES
+        }
+        return users.values('id').annotate(**counts).values(*OrderCountHelper.STATUSES).first()
@@ -0,0 +1,94 @@
+import csv
+import json
+from rest_framework import serializers
+
+class Echo:
+    """
+    Write-only file-like object that hands each written line back instead of buffering it.
+    """
+    def write(self, value):
+        return value
+
+
+class OrderExportHelper:
+    """
+    Streams a queryset of orders as CSV or NDJSON for the order export.
+    Rows are read as plain values in chunks and written one by one, so memory stays flat for any number of orders.
+    Values are rendered like OrderSerializer renders them.
+    """
+    FIELDS = [
+        "id",
+        "customer_user",
+        "business_user",
+        "title",
+        "revisions",
+        "delivery_time_in_days",
+        "price",
+        "features",
+        "offer_type",
+        "status",
+        "created_at",
+        "updated_at"
+    ]
+    FORMATS = {
+        "csv": "text/csv",
+        "ndjson": "application/x-ndjson",
+    }
+    CHUNK_SIZE = 2000
+    FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+    CONVERTERS = {
+        "price": serializers.FloatField().to_representation,
+        "created_at": serializers.DateTimeField().to_representation,
+        "updated_at": serializers.DateTimeField().to_representation,
+    }
+
+    @staticmethod
+    def get_rows(queryset):
+        """
+        Yields the export fields of each order as a dict, fetching CHUNK_SIZE rows at a time.
+        """
+        converters = OrderExportHelper.CONVERTERS
+        rows = queryset.order_by('created_at', 'id').values(*OrderExportHelper.FIELDS)
+        for row in rows.iterator(chunk_size=OrderExportHelper.CHUNK_SIZE):
+            for field, convert in converters.items():
+                row[field] = convert(row[field])
+            yield row
+
+    @staticmethod
+    def escape_cell(value):
+        """
+        Prefixes text cells starting with a formula character with a quote, so spreadsheets show them as text.
+        """
+        if isinstance(value, str) and value.startswith(OrderExportHelper.FORMULA_PREFIXES):
+            return f"'{value}"
+        return value
+
+    @staticmethod
+    def stream_csv(queryset):
+        """
+        Yields a header line and one CSV line per order. Features are written as a JSON list.
+        Text cells are escaped against formula injection.
+        """
+        writer = csv.writer(Echo())
+        escape = OrderExportHelper.escape_cell
+        yield writer.writerow(OrderExportHelper.FIELDS)
+        for row in OrderExportHelper.get_rows(queryset):
+            row["features"] = json.dumps(row["features"])
+            yield writer.writerow([escape(value) for value in row.values()])
+
+    @staticmethod
+    def stream_ndjson(queryset):
+        """
+        Yields one JSON object per order and line.
+        """
+        for row in OrderExportHelper.get_rows(queryset):
+            yield json.dumps(row) + "\n"
+
+    @staticmethod
+    def stream(queryset, export_format: str):
+        """
+        Returns the line generator for the given export format.
+        """
+        if export_format == "csv":
+            return OrderExportHelper.stream_csv(queryset)
+        return OrderExportHelper.stream_ndjson(queryset)
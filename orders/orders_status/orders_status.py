@@ -0,0 +1,62 @@
+from django.db import transaction
+from django.utils import timezone
+from orders.models import Order
+
+class OrderStatusHelper:
+    """
+    Applies a status change to many orders of one business user at once.
+    Ownership and the current status of all orders are checked with one locking query,
+    and the allowed orders are updated with a single UPDATE.
+    """
+    TRANSITIONS = {
+        "in_progress": {"completed", "cancelled"},
+        "completed": set(),
+        "cancelled": set(),
+    }
+
+    @staticmethod
+    def can_transition(current_status: str, target_status: str):
+        """
+        Tells whether an order with the current status may be moved to the target status.
+        """
+        return target_status in OrderStatusHelper.TRANSITIONS.get(current_status, set())
+
+    @staticmethod
+    def bulk_transition(business_user, order_ids, target_status: str):
+        """
+        Moves the given orders of the business user to the target status and returns one result per given id:
+        - updated: the order was moved to the target status
+        - unchanged: the order already had the target status
+        - invalid_transition: the order's status can not be changed to the target status
+        - not_found: no order of this business user has the id
+        - duplicate: the id was already given earlier in the batch
+        """
+        with transaction.atomic():
+            current_statuses = dict(
+                Order.objects.select_for_update()
+                .filter(pk__in=order_ids, business_user=business_user)
+                .values_list('id', 'status')
+            )
+            updatable_ids = [
+                order_id for order_id, status in current_statuses.items()
+                if OrderStatusHelper.can_transition(status, target_status)
+            ]
+            if updatable_ids:
+                Order.objects.filter(pk__in=updatable_ids).update(status=target_status, updated_at=timezone.now())
+
+        results = []
+        seen_ids = set()
+        for order_id in order_ids:
+            status = current_statuses.get(order_id)
+            if order_id in seen_ids:
+                results.append({"id": order_id, "result": "duplicate"})
+            elif status is None:
+                results.append({"id": order_id, "result": "not_found"})
+            elif status == target_status:
+                results.append({"id": order_id, "result": "unchanged", "status": status})
+            elif OrderStatusHelper.can_transition(status, target_status):
+                results.append({"id": order_id, "result": "updated", "status": target_status})
+            else:
+                results.append({"id": order_id, "result": "invalid_transition", "status": status})
+            seen_ids.add(order_id)
+        return results
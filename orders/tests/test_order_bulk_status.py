@@ -0,0 +1,91 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from auth_app.models import UserProfile
+from orders.models import Order
+
+
+class OrderBulkStatusTest(APITestCase):
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username="business", password="testpassword")
+        self.customer_user = User.objects.create_user(username="customer", password="testpassword")
+        self.other_business = User.objects.create_user(username="other", password="testpassword")
+        UserProfile.objects.create(user=self.business_user, type="business")
+        UserProfile.objects.create(user=self.customer_user, type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_user)
+        self.url = reverse('order-bulk-status')
+
+    def create_order(self, business_user, status="in_progress"):
+        return Order.objects.create(
+            customer_user=self.customer_user,
+            business_user=business_user,
+            title="Logo Design",
+            revisions=2,
+            delivery_time_in_days=7,
+            price=75,
+            features=["Logo Design"],
+            offer_type="basic",
+            status=status
+        )
+
+    def test_bulk_complete_orders(self):
+        open_orders = [self.create_order(self.business_user) for _ in range(3)]
+        ids = [order.id for order in open_orders]
+
+        with self.assertNumQueries(4):
+            response = self.client.patch(self.url, {"order_ids": ids, "status": "completed"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([result["result"] for result in response.data["results"]], ["updated"] * 3)
+        self.assertEqual(Order.objects.filter(pk__in=ids, status="completed").count(), 3)
+
+    def test_bulk_status_reports_per_id_results(self):
+        open_order = self.create_order(self.business_user)
+        completed_order = self.create_order(self.business_user, status="completed")
+        cancelled_order = self.create_order(self.business_user, status="cancelled")
+        foreign_order = self.create_order(self.other_business)
+        ids = [open_order.id, completed_order.id, cancelled_order.id, foreign_order.id, 9999]
+
+        response = self.client.patch(self.url, {"order_ids": ids, "status": "completed"}, format="json")
+
+        self.assertEqual(response.data["results"], [
+            {"id": open_order.id, "result": "updated", "status": "completed"},
+            {"id": completed_order.id, "result": "unchanged", "status": "completed"},
+            {"id": cancelled_order.id, "result": "invalid_transition", "status": "cancelled"},
+            {"id": foreign_order.id, "result": "not_found"},
+            {"id": 9999, "result": "not_found"},
+        ])
+        foreign_order.refresh_from_db()
+        cancelled_order.refresh_from_db()
+        self.assertEqual(foreign_order.status, "in_progress")
+        self.assertEqual(cancelled_order.status, "cancelled")
+
+    def test_bulk_status_reports_duplicate_ids(self):
+        open_order = self.create_order(self.business_user)
+
+        response = self.client.patch(self.url, {"order_ids": [open_order.id, 9999, open_order.id, 9999], "status": "cancelled"}, format="json")
+
+        self.assertEqual(response.data["results"], [
+            {"id": open_order.id, "result": "updated", "status": "cancelled"},
+            {"id": 9999, "result": "not_found"},
+            {"id": open_order.id, "result": "duplicate"},
+            {"id": 9999, "result": "duplicate"},
+        ])
+
+    def test_bulk_status_invalid_payload_400(self):
+        response = self.client.patch(self.url, {"order_ids": [], "status": "done"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("order_ids", response.data)
+        self.assertIn("status", response.data)
+
+    def test_bulk_status_customer_403(self):
+        order = self.create_order(self.business_user)
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.patch(self.url, {"order_ids": [order.id], "status": "completed"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
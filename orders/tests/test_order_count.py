@@ -100,3 +100,60 @@ class OrderCompletedCountTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["completed_order_count"], 2)
 
+
+
+class OrderStatusCountTest(APITestCase):
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            username="Business",
+            email="business@email.com",
+            password="testpassword1"
+        )
+        self.profile = UserProfile.objects.create(user=self.business_user, type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_user)
+
+        self.customer_user = User.objects.create_user(
+            username="Customer",
+            email="customer@email.com",
+            password="testpassword2"
+        )
+        self.profile = UserProfile.objects.create(user=self.customer_user, type="customer")
+
+        for order_status in ["in_progress", "completed", "completed"]:
+            Order.objects.create(
+                customer_user=self.customer_user,
+                business_user=self.business_user,
+                title="Logo Design",
+                revisions=2,
+                delivery_time_in_days=7,
+                price=75,
+                features=["Logo Design"],
+                offer_type="basic",
+                status=order_status
+            )
+
+    def test_get_order_status_count_in_one_query(self):
+        url = reverse('order-status-count', kwargs={'business_user_id': self.business_user.id})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"in_progress": 1, "completed": 2, "cancelled": 0})
+
+    def test_get_order_status_count_for_customer_404(self):
+        url = reverse('order-status-count', kwargs={'business_user_id': self.customer_user.id})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_order_count_views_use_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-count', kwargs={'business_user_id': self.business_user.id}))
+        self.assertEqual(response.data["order_count"], 1)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-completed-count', kwargs={'business_user_id': self.business_user.id}))
+        self.assertEqual(response.data["completed_order_count"], 2)
@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from auth_app.models import UserProfile
+from orders.models import Order
+from orders.api.serializers import OrderSerializer
+
+
+class OrderExportTest(APITestCase):
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username="business", password="testpassword")
+        self.customer_user = User.objects.create_user(username="customer", password="testpassword")
+        self.other_business = User.objects.create_user(username="other", password="testpassword")
+        UserProfile.objects.create(user=self.business_user, type="business")
+        UserProfile.objects.create(user=self.customer_user, type="customer")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_user)
+
+        self.orders = [
+            self.create_order(self.business_user, "Logo", "in_progress"),
+            self.create_order(self.business_user, "Flyer, \"Print\"", "completed"),
+        ]
+        self.create_order(self.other_business, "Other", "in_progress")
+
+    def create_order(self, business_user, title, status):
+        return Order.objects.create(
+            customer_user=self.customer_user,
+            business_user=business_user,
+            title=title,
+            revisions=2,
+            delivery_time_in_days=5,
+            price="150.50",
+            features=["Logo Design", "Flyer"],
+            offer_type="basic",
+            status=status
+        )
+
+    def get_content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson_matches_order_serializer(self):
+        response = self.client.get(reverse('order-export'), {'export_format': 'ndjson'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in self.get_content(response).splitlines()]
+        expected = json.loads(json.dumps(OrderSerializer(self.orders, many=True).data))
+        self.assertEqual(rows, expected)
+
+    def test_export_csv(self):
+        response = self.client.get(reverse('order-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('filename="orders.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(self.get_content(response))))
+        self.assertEqual([row["title"] for row in rows], ["Logo", "Flyer, \"Print\""])
+        self.assertEqual(rows[0]["price"], "150.5")
+        self.assertEqual(json.loads(rows[0]["features"]), ["Logo Design", "Flyer"])
+
+    def test_export_csv_escapes_formulas(self):
+        for title in ("=HYPERLINK(\"http://example.com\")", "+1", "-1", "@SUM(A1)"):
+            self.create_order(self.business_user, title, "in_progress")
+
+        response = self.client.get(reverse('order-export'))
+
+        rows = list(csv.DictReader(io.StringIO(self.get_content(response))))
+        self.assertEqual(
+            [row["title"] for row in rows[2:]],
+            ["'=HYPERLINK(\"http://example.com\")", "'+1", "'-1", "'@SUM(A1)"]
+        )
+
+    def test_export_applies_filters(self):
+        response = self.client.get(reverse('order-export'), {'export_format': 'ndjson', 'status': 'completed'})
+
+        rows = [json.loads(line) for line in self.get_content(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.orders[1].id])
+
+    def test_export_invalid_format_400(self):
+        response = self.client.get(reverse('order-export'), {'export_format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_customer_403(self):
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.get(reverse('order-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
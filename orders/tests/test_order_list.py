@@ -1,10 +1,13 @@
+from datetime import timedelta
 from django.urls import reverse
+from django.utils import timezone
 from django.contrib.auth.models import User
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
 from rest_framework import status
 from auth_app.models import UserProfile
 from offers.models import Offer, OfferDetails
+from orders.models import Order
 
 
 class OrderGetTest(APITestCase):
@@ -73,3 +76,82 @@ class OrderPostTest(APITestCase):
         self.assertEqual(response.data["features"], ["Logo Design", "Visitenkarte"])
         self.assertEqual(response.data["offer_type"], "basic")
         self.assertEqual(response.data["status"], "in_progress")
+
+
+class OrderListFilterTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@email.com",
+            password="testpassword"
+        )
+        self.profile = UserProfile.objects.create(user=self.user, type="business")
+        self.other_user = User.objects.create_user(username="otheruser", password="testpassword")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.create_order(self.other_user, self.user, "in_progress", "basic")
+        self.create_order(self.other_user, self.user, "completed", "premium")
+        self.create_order(self.user, self.other_user, "completed", "basic")
+        self.create_order(self.other_user, self.other_user, "completed", "basic")
+        self.old_order = self.create_order(self.other_user, self.user, "cancelled", "standard")
+        Order.objects.filter(pk=self.old_order.pk).update(created_at=timezone.now() - timedelta(days=30))
+
+    def create_order(self, customer_user, business_user, order_status, offer_type):
+        return Order.objects.create(
+            customer_user=customer_user,
+            business_user=business_user,
+            title="Logo Design",
+            revisions=2,
+            delivery_time_in_days=7,
+            price=75,
+            features=["Logo Design"],
+            offer_type=offer_type,
+            status=order_status
+        )
+
+    def get_order_ids(self, **params):
+        response = self.client.get(reverse('order-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [order["id"] for order in response.data["results"]]
+
+    def test_order_list_contains_customer_and_business_orders(self):
+        expected = Order.objects.exclude(customer_user=self.other_user, business_user=self.other_user)
+        self.assertEqual(self.get_order_ids(page_size=10), list(expected.order_by('-created_at', '-id').values_list('id', flat=True)))
+
+    def test_order_list_is_cursor_paginated(self):
+        response = self.client.get(reverse('order-list'), {'page_size': 3})
+
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(self.client.get(response.data["next"]).data["results"]), 1)
+
+    def test_order_list_filters_by_status_and_offer_type(self):
+        self.assertEqual(len(self.get_order_ids(status="completed")), 2)
+        self.assertEqual(len(self.get_order_ids(status="completed", offer_type="basic")), 1)
+
+    def test_order_list_filters_by_date_range(self):
+        since = (timezone.now() - timedelta(days=1)).date().isoformat()
+        until = (timezone.now() - timedelta(days=1)).isoformat()
+
+        self.assertNotIn(self.old_order.id, self.get_order_ids(created_after=since))
+        self.assertEqual(self.get_order_ids(created_before=until), [self.old_order.id])
+
+    def test_order_list_pages_through_equal_creation_times(self):
+        Order.objects.filter(pk__in=self.get_order_ids(page_size=10)).update(created_at=timezone.now())
+        expected = self.get_order_ids(page_size=10)
+
+        seen, url, params = [], reverse('order-list'), {'page_size': 1}
+        while url:
+            response = self.client.get(url, params)
+            seen += [order["id"] for order in response.data["results"]]
+            url, params = response.data["next"], None
+        self.assertEqual(seen, expected)
+
+        previous = self.client.get(response.data["previous"]).data
+        self.assertEqual([order["id"] for order in previous["results"]], [expected[-2]])
+
+    def test_order_list_rejects_invalid_cursor(self):
+        response = self.client.get(reverse('order-list'), {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
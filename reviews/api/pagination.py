@@ -0,0 +1,10 @@
+from rest_framework.pagination import PageNumberPagination
+
+class ReviewPagination(PageNumberPagination):
+    """
+    Page-number pagination for the review list with 6 reviews per page by default.
+    Supports custom page size up to a maximum of 100 via query parameter.
+    """
+    page_size = 6
+    page_size_query_param = 'page_size'
+    max_page_size = 100
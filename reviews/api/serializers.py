@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.serialization import ValuesSerializer, datetime_converter
 from reviews.models import Review
 
 
@@ -42,4 +43,17 @@ class ReviewSerializer(serializers.ModelSerializer):
         before creating a Review instance.
         """
         validated_data['reviewer'] = self.context['request'].user
-        return super().create(validated_data)
\ No newline at end of file
+        return super().create(validated_data)
+
+
+class ReviewValuesSerializer(ValuesSerializer):
+    """
+    Read-only list serializer producing the same output as ReviewSerializer from .values() rows.
+    """
+    fields = ReviewSerializer.Meta.fields
+
+    def get_converters(self):
+        return {
+            'created_at': datetime_converter(),
+            'updated_at': datetime_converter(),
+        }
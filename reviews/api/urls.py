@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import ReviewListCreateView, ReviewDetailsView
+from .views import ReviewListCreateView, ReviewDetailsView, RatingSummaryView
 
 
 urlpatterns = [
     path('reviews/', ReviewListCreateView.as_view(), name='review-list'),
     path('reviews/<int:pk>/', ReviewDetailsView.as_view(), name='review-detail'),
-]
\ No newline at end of file
+    path('review-summary/<int:business_user_id>/', RatingSummaryView.as_view(), name='review-summary'),
+]
@@ -1,26 +1,50 @@
+from django.db.models import Count, Max
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, filters
 from rest_framework.exceptions import PermissionDenied, MethodNotAllowed
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from reviews.models import Review
-from .serializers import ReviewSerializer
+from rest_framework.views import APIView
+from reviews.models import Review, RatingSummary
+from .pagination import ReviewPagination
+from .serializers import ReviewSerializer, ReviewValuesSerializer
 from orders.models import Order
+from auth_app.api.authentication import get_request_profile
+from core.conditional import check_conditions, make_etag, set_validators
+from core.serialization import ValuesListMixin
 
 
-class ReviewListCreateView(generics.ListCreateAPIView):
+class ReviewListCreateView(ValuesListMixin, generics.ListCreateAPIView):
     """
     Lists all reviews and allows authenticated customers to create reviews.
     Filters by business_user_id and reviewer_id, supports ordering by updated_at or rating.
+    Results are paginated, newest updates first by default, and built from .values() rows by ReviewValuesSerializer.
+    List responses carry an ETag built from the newest updated_at and the number of matching reviews.
     perform_create: ensures only customers with completed orders can review a business_user.
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
+    values_serializer_class = ReviewValuesSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['business_user_id', 'reviewer_id']
     ordering_fields = ['updated_at', 'rating']
+    ordering = ['-updated_at', '-id']
     permission_classes = [IsAuthenticated]
-    pagination_class = None
+    pagination_class = ReviewPagination
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns 304 if no matching review was added, changed or deleted since the client's copy,
+        checked with a single aggregate query before the page is loaded.
+        There is no Last-Modified, since deleting a review does not advance the newest updated_at.
+        """
+        state = self.filter_queryset(self.get_queryset()).aggregate(last_modified=Max('updated_at'), count=Count('id'))
+        etag = make_etag(request, state['count'], state['last_modified'])
+        if (response := check_conditions(request, etag)) is not None:
+            return response
+
+        response = super().list(request, *args, **kwargs)
+        return set_validators(response, etag)
 
     def perform_create(self, serializer):
         """
@@ -28,8 +52,9 @@ class ReviewListCreateView(generics.ListCreateAPIView):
         and a completed order exists before saving the review.
         """
         user = self.request.user
+        profile = get_request_profile(self.request)
 
-        if not user.profile.type == 'customer':
+        if profile is None or not profile.type == 'customer':
             raise PermissionDenied("Only customers can create reviews")
 
         business_user = self.request.data.get("business_user")
@@ -93,4 +118,26 @@ class ReviewDetailsView(generics.RetrieveUpdateDestroyAPIView):
     
     def put(self, request, *args, **kwargs):
         """PUT method not allowed for this endpoint."""
-        raise MethodNotAllowed("PUT")
\ No newline at end of file
+        raise MethodNotAllowed("PUT")
+
+class RatingSummaryView(APIView):
+    """
+    Returns the stored rating summary of a business user: review count, average rating
+    and a histogram of the ratings 1 to 5. Business users without reviews get zeros.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        """
+        Reads the business user's rating summary row and returns it.
+        """
+        summary = RatingSummary.objects.filter(pk=business_user_id).first()
+        if summary is None:
+            summary = RatingSummary(business_user_id=business_user_id)
+
+        return Response({
+            "business_user": business_user_id,
+            "review_count": summary.review_count,
+            "average_rating": summary.average_rating,
+            "rating_histogram": summary.histogram,
+        })
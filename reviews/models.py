@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Count, F, Q, Sum
 from django.utils.timezone import now
 from django.contrib.auth.models import User
 
@@ -16,6 +17,11 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['reviewer', 'business_user'], name='review_reviewer_business_idx'),
+        ]
+
     def update(self, **kwargs):
         """
         Overrides save to update the `updated_at` timestamp when called.
@@ -25,4 +31,68 @@ class Review(models.Model):
         super().save(**kwargs)
 
     def __str__(self):
-        return f"{self.reviewer} reviewed {self.business_user}"
\ No newline at end of file
+        return f"{self.reviewer} reviewed {self.business_user}"
+
+class RatingSummary(models.Model):
+    """
+    Per-business-user rating aggregates maintained on every review write.
+    Stores the review count, the rating sum and a histogram of the ratings 1 to 5,
+    so a profile's rating summary is a single-row read.
+    """
+    business_user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="rating_summary")
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+
+    HISTOGRAM_RATINGS = range(1, 6)
+
+    class Meta:
+        verbose_name_plural = "Rating summaries"
+
+    def __str__(self):
+        return f"Rating summary of {self.business_user_id}"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @property
+    def histogram(self):
+        return {str(rating): getattr(self, f"rating_{rating}") for rating in self.HISTOGRAM_RATINGS}
+
+    @classmethod
+    def adjust(cls, business_user_id, rating, delta):
+        """
+        Adds (delta=1) or removes (delta=-1) one rating in a single UPDATE.
+        A missing row is rebuilt from the reviews table when adding; removals skip it,
+        since the business user may be in the middle of a cascading delete.
+        """
+        changes = {
+            'review_count': F('review_count') + delta,
+            'rating_sum': F('rating_sum') + delta * rating,
+        }
+        if rating in cls.HISTOGRAM_RATINGS:
+            changes[f"rating_{rating}"] = F(f"rating_{rating}") + delta
+        if not cls.objects.filter(pk=business_user_id).update(**changes) and delta > 0:
+            cls.rebuild(business_user_id)
+
+    @classmethod
+    def rebuild(cls, business_user_id):
+        """
+        Recomputes the summary of one business user from the reviews table.
+        """
+        counts = {f"rating_{rating}": Count('id', filter=Q(rating=rating)) for rating in cls.HISTOGRAM_RATINGS}
+        aggregates = Review.objects.filter(business_user_id=business_user_id).aggregate(
+            review_count=Count('id'),
+            rating_sum=Sum('rating'),
+            **counts
+        )
+        aggregates['rating_sum'] = aggregates['rating_sum'] or 0
+        summary, created = cls.objects.update_or_create(business_user_id=business_user_id, defaults=aggregates)
+        return summary
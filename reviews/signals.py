@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from reviews.models import RatingSummary, Review
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_review(sender, instance, **kwargs):
+    """
+    Stores the rating and business user currently saved in the database,
+    so that update handlers can apply only the difference.
+    """
+    if instance._state.adding:
+        return
+    previous = Review.objects.filter(pk=instance.pk).values('rating', 'business_user_id').first()
+    if previous is not None:
+        instance._previous_rating = previous['rating']
+        instance._previous_business_user_id = previous['business_user_id']
+
+
+@receiver(post_save, sender=Review)
+def summarize_saved_review(sender, instance, created, **kwargs):
+    """
+    Adds new reviews to the business user's rating summary and moves changed ratings.
+    """
+    if created:
+        RatingSummary.adjust(instance.business_user_id, instance.rating, 1)
+        return
+    previous = (getattr(instance, '_previous_business_user_id', None), getattr(instance, '_previous_rating', None))
+    if None not in previous and previous != (instance.business_user_id, instance.rating):
+        RatingSummary.adjust(*previous, -1)
+        RatingSummary.adjust(instance.business_user_id, instance.rating, 1)
+
+
+@receiver(post_delete, sender=Review)
+def summarize_deleted_review(sender, instance, **kwargs):
+    """
+    Removes a deleted review from the business user's rating summary.
+    """
+    RatingSummary.adjust(instance.business_user_id, instance.rating, -1)
@@ -43,6 +43,8 @@ class ReviewListGetTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Review.objects.count(), 1)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["rating"], 4)
 
 
 class ReviewListPostTest(APITestCase):
@@ -106,4 +108,35 @@ class ReviewListPostTest(APITestCase):
         self.assertEqual(response.data["business_user"], self.business_user.id)
         self.assertEqual(response.data["reviewer"], self.customer_user.id)
         self.assertEqual(response.data["rating"], 4)
-        self.assertEqual(response.data["description"], "Sehr professioneller Service.")
\ No newline at end of file
+        self.assertEqual(response.data["description"], "Sehr professioneller Service.")
+
+
+class ReviewListConditionalGetTest(APITestCase):
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username="Business", password="testpassword1")
+        self.customer_user = User.objects.create_user(username="Customer", password="testpassword2")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_user)
+        self.review = Review.objects.create(
+            business_user=self.business_user, reviewer=self.customer_user, rating=4, description="Gut."
+        )
+
+    def test_unchanged_list_is_answered_with_304(self):
+        url = reverse('review-list')
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_deleted_review_changes_etag(self):
+        url = reverse('review-list')
+        etag = self.client.get(url)["ETag"]
+
+        self.review.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
@@ -0,0 +1,58 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from auth_app.models import UserProfile
+from reviews.models import Review, RatingSummary
+
+
+class ReviewSummaryTest(APITestCase):
+
+    def setUp(self):
+        self.business_user = User.objects.create_user(username="Business", password="testpassword1")
+        UserProfile.objects.create(user=self.business_user, type="business")
+        self.other_business_user = User.objects.create_user(username="OtherBusiness", password="testpassword3")
+        UserProfile.objects.create(user=self.other_business_user, type="business")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.business_user)
+
+        self.reviews = []
+        for index, rating in enumerate([5, 4, 4]):
+            reviewer = User.objects.create_user(username=f"Customer{index}", password="testpassword2")
+            self.reviews.append(Review.objects.create(business_user=self.business_user, reviewer=reviewer, rating=rating, description="Review."))
+
+    def get_summary(self, business_user):
+        url = reverse('review-summary', kwargs={'business_user_id': business_user.id})
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_get_review_summary(self):
+        data = self.get_summary(self.business_user)
+
+        self.assertEqual(data["review_count"], 3)
+        self.assertEqual(data["average_rating"], 4.3)
+        self.assertEqual(data["rating_histogram"], {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1})
+
+    def test_review_summary_follows_updates_and_deletes(self):
+        self.reviews[0].rating = 1
+        self.reviews[0].save()
+        self.reviews[1].business_user = self.other_business_user
+        self.reviews[1].save()
+        self.reviews[2].delete()
+
+        self.assertEqual(self.get_summary(self.business_user)["rating_histogram"], {"1": 1, "2": 0, "3": 0, "4": 0, "5": 0})
+        self.assertEqual(self.get_summary(self.other_business_user)["rating_histogram"], {"1": 0, "2": 0, "3": 0, "4": 1, "5": 0})
+
+    def test_review_summary_matches_rebuild(self):
+        stored = RatingSummary.objects.get(pk=self.business_user.id)
+        rebuilt = RatingSummary.rebuild(self.business_user.id)
+
+        self.assertEqual((stored.review_count, stored.rating_sum, stored.histogram), (rebuilt.review_count, rebuilt.rating_sum, rebuilt.histogram))
+
+    def test_review_summary_without_reviews(self):
+        data = self.get_summary(self.other_business_user)
+
+        self.assertEqual(data["review_count"], 0)
+        self.assertEqual(data["average_rating"], 0)